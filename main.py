@@ -13,6 +13,8 @@ def main():
         port=settings.PORT,
         reload=False,
         workers=1,  # Single worker (K8s pattern: scale via pod replicas)
+        loop="uvloop",  # libuv-based event loop instead of asyncio's default
+        http="httptools",  # C HTTP parser instead of pure-Python h11
         log_level=settings.LOG_LEVEL.lower(),
     )
 
@@ -1,171 +1,195 @@
 """FastAPI dependencies for request handling."""
 
-from typing import Annotated
+from collections.abc import Iterable
 
-from fastapi import HTTPException, Query
+from fastapi import Request
 
+from .errors import RawHTTPError, error_body
 
-def get_latitude_param(
-    lat: Annotated[float | None, Query(ge=-90.0, le=90.0)] = None,
-    latitude: Annotated[float | None, Query(ge=-90.0, le=90.0)] = None,
-    LAT: Annotated[float | None, Query(ge=-90.0, le=90.0)] = None,
-    Lat: Annotated[float | None, Query(ge=-90.0, le=90.0)] = None,
-    LATITUDE: Annotated[float | None, Query(ge=-90.0, le=90.0)] = None,
-    Latitude: Annotated[float | None, Query(ge=-90.0, le=90.0)] = None,
-) -> float | None:
-    """Get latitude parameter with case-insensitive support and conflict detection.
+# Coordinates are quantized to 2 decimal places (~1 km), well below Open-Meteo's
+# grid resolution, so nearby requests share cache entries and upstream calls
+COORDINATE_DECIMALS = 2
 
-    Supports: lat, latitude, LAT, Lat, LATITUDE, Latitude
-    Priority: lowercase short > lowercase long > mixed/uppercase
+
+def _coordinate_error_bodies(
+    short_name: str, long_name: str, limit: float
+) -> dict[str, bytes]:
+    """Serialize the fixed validation error bodies for one coordinate.
+
+    Args:
+        short_name: Short parameter name (lat/lon)
+        long_name: Long parameter name (latitude/longitude)
+        limit: Absolute bound of the valid range (90 or 180)
+
+    Returns:
+        Error bodies keyed by error kind
+
+    Example:
+        >>> _coordinate_error_bodies("lat", "latitude", 90.0)["missing"]
+        b'{"detail":{"error":"Latitude parameter required (lat or latitude)"}}'
+    """
+    name = long_name.capitalize()
+    return {
+        "not_a_number": error_body(f"{name} must be a number"),
+        "conflict": error_body(
+            f"Conflicting {long_name} values provided ({short_name} and {long_name})"
+        ),
+        "missing": error_body(
+            f"{name} parameter required ({short_name} or {long_name})"
+        ),
+        "out_of_range": error_body(f"{name} must be between {-limit:g} and {limit:g}"),
+    }
+
+
+# Error bodies are serialized once at import instead of on every raise
+_ERROR_BODIES = {
+    "latitude": _coordinate_error_bodies("lat", "latitude", 90.0),
+    "longitude": _coordinate_error_bodies("lon", "longitude", 180.0),
+}
+
+
+def _parse_coordinate(value: str, name: str) -> float:
+    """Parse a raw query value into a float.
+
+    Args:
+        value: Raw query parameter value
+        name: Coordinate name used in error messages (latitude or longitude)
+
+    Returns:
+        Parsed value
+
+    Raises:
+        RawHTTPError: 422 if the value is not a number
+
+    Example:
+        >>> _parse_coordinate("52.52", "latitude")
+        52.52
+    """
+    try:
+        return float(value)
+    except ValueError:
+        raise RawHTTPError(422, _ERROR_BODIES[name]["not_a_number"]) from None
+
+
+def _resolve_coordinate(
+    short_value: str | None,
+    long_value: str | None,
+    long_name: str,
+    limit: float,
+) -> float:
+    """Pick a coordinate from its short and long query parameter forms.
+
+    The short form takes precedence; both forms may be given only if they agree.
+    The range is checked once, on the selected value.
+
+    Args:
+        short_value: Raw value of the short form (lat/lon), if present
+        long_value: Raw value of the long form (latitude/longitude), if present
+        long_name: Long parameter name
+        limit: Absolute bound of the valid range (90 or 180)
+
+    Returns:
+        Parsed coordinate value
+
+    Raises:
+        RawHTTPError: 400 if missing or conflicting, 422 if invalid
+
+    Example:
+        >>> _resolve_coordinate(None, "13.41", "longitude", 180.0)
+        13.41
+    """
+    if short_value is not None:
+        coordinate = _parse_coordinate(short_value, long_name)
+        if (
+            long_value is not None
+            and _parse_coordinate(long_value, long_name) != coordinate
+        ):
+            raise RawHTTPError(400, _ERROR_BODIES[long_name]["conflict"])
+    elif long_value is not None:
+        coordinate = _parse_coordinate(long_value, long_name)
+    else:
+        raise RawHTTPError(400, _ERROR_BODIES[long_name]["missing"])
+
+    # Also rejects NaN, which fails every comparison
+    if not -limit <= coordinate <= limit:
+        raise RawHTTPError(422, _ERROR_BODIES[long_name]["out_of_range"])
+    return coordinate
+
+
+def parse_coordinates(params: Iterable[tuple[str, str]]) -> tuple[float, float]:
+    """Parse latitude and longitude from case-insensitive query parameters.
+
+    Parameter names are matched case-insensitively, so lat, LAT, Lat and
+    latitude, LATITUDE, Latitude (and likewise for longitude) all work.
+    The short form (lat/lon) takes precedence over the long form.
 
     Detects conflicts: if lat=52.52 and latitude=52.53 (different values), returns 400.
+    Validated coordinates are rounded to COORDINATE_DECIMALS decimal places.
 
     Args:
-        lat: Latitude (lowercase short form)
-        latitude: Latitude (lowercase long form)
-        LAT: Latitude (uppercase short form)
-        Lat: Latitude (mixed case short form)
-        LATITUDE: Latitude (uppercase long form)
-        Latitude: Latitude (mixed case long form)
+        params: Query parameters as (name, value) pairs
 
     Returns:
-        Latitude value or None
+        Tuple of rounded (latitude, longitude)
 
     Raises:
-        HTTPException: 400 if conflicting values provided
+        RawHTTPError: 400 if a coordinate is missing or conflicting,
+            422 if a coordinate is not a number or is out of range
 
     Example:
-        >>> # GET /v1/current?LAT=52.52&lon=13.41
-        >>> # Returns: 52.52
+        >>> parse_coordinates([("LAT", "52.52"), ("lon", "13.41")])
+        (52.52, 13.41)
+        >>> parse_coordinates([("lat", "52.52001"), ("lon", "13.409")])
+        (52.52, 13.41)
     """
-    # Collect all non-None values (normalized to lowercase names)
-    values = {}
-    if lat is not None:
-        values["lat"] = lat
-    if Lat is not None:
-        values["lat_mixed"] = Lat
-    if LAT is not None:
-        values["lat_upper"] = LAT
-    if latitude is not None:
-        values["latitude"] = latitude
-    if Latitude is not None:
-        values["latitude_mixed"] = Latitude
-    if LATITUDE is not None:
-        values["latitude_upper"] = LATITUDE
-
-    if not values:
-        return None
-
-    # Check for conflicts between short and long forms
-    short_values = {
-        v
-        for k, v in values.items()
-        if k.startswith("lat") and not k.startswith("latitude")
-    }
-    long_values = {v for k, v in values.items() if k.startswith("latitude")}
-
-    # If both short and long forms provided with different values, that's a conflict
-    if short_values and long_values and short_values != long_values:
-        raise HTTPException(
-            status_code=400,
-            detail={"error": "Conflicting latitude values provided (lat and latitude)"},
-        )
-
-    # Return first available value with priority
-    if lat is not None:
-        return lat
-    if Lat is not None:
-        return Lat
-    if LAT is not None:
-        return LAT
-    if latitude is not None:
-        return latitude
-    if Latitude is not None:
-        return Latitude
-    if LATITUDE is not None:
-        return LATITUDE
-    return None
-
-
-def get_longitude_param(
-    lon: Annotated[float | None, Query(ge=-180.0, le=180.0)] = None,
-    longitude: Annotated[float | None, Query(ge=-180.0, le=180.0)] = None,
-    LON: Annotated[float | None, Query(ge=-180.0, le=180.0)] = None,
-    Lon: Annotated[float | None, Query(ge=-180.0, le=180.0)] = None,
-    LONGITUDE: Annotated[float | None, Query(ge=-180.0, le=180.0)] = None,
-    Longitude: Annotated[float | None, Query(ge=-180.0, le=180.0)] = None,
-) -> float | None:
-    """Get longitude parameter with case-insensitive support and conflict detection.
-
-    Supports: lon, longitude, LON, Lon, LONGITUDE, Longitude
-    Priority: lowercase short > lowercase long > mixed/uppercase
-
-    Detects conflicts: if lon=13.41 and longitude=13.42 (different values), returns 400.
+    lat = latitude = lon = longitude = None
+
+    # First occurrence of each form wins; remaining parameters are ignored
+    for key, value in params:
+        name = key.lower()
+        if name == "lat":
+            if lat is None:
+                lat = value
+        elif name == "lon":
+            if lon is None:
+                lon = value
+        elif name == "latitude":
+            if latitude is None:
+                latitude = value
+        elif name == "longitude":
+            if longitude is None:
+                longitude = value
+
+    return (
+        round(
+            _resolve_coordinate(lat, latitude, "latitude", 90.0),
+            COORDINATE_DECIMALS,
+        ),
+        round(
+            _resolve_coordinate(lon, longitude, "longitude", 180.0),
+            COORDINATE_DECIMALS,
+        ),
+    )
+
+
+async def get_coordinates(request: Request) -> tuple[float, float]:
+    """Get latitude and longitude from the request query string.
+
+    Reads the query string once and parses only the values that are used.
+    See parse_coordinates for the accepted parameter names.
 
     Args:
-        lon: Longitude (lowercase short form)
-        longitude: Longitude (lowercase long form)
-        LON: Longitude (uppercase short form)
-        Lon: Longitude (mixed case short form)
-        LONGITUDE: Longitude (uppercase long form)
-        Longitude: Longitude (mixed case long form)
+        request: The incoming request
 
     Returns:
-        Longitude value or None
+        Tuple of rounded (latitude, longitude)
 
     Raises:
-        HTTPException: 400 if conflicting values provided
+        RawHTTPError: 400 if a coordinate is missing or conflicting,
+            422 if a coordinate is not a number or is out of range
 
     Example:
-        >>> # GET /v1/current?lat=52.52&LON=13.41
-        >>> # Returns: 13.41
+        >>> # GET /v1/current?LAT=52.52&lon=13.41
+        >>> # Returns: (52.52, 13.41)
     """
-    # Collect all non-None values (normalized to lowercase names)
-    values = {}
-    if lon is not None:
-        values["lon"] = lon
-    if Lon is not None:
-        values["lon_mixed"] = Lon
-    if LON is not None:
-        values["lon_upper"] = LON
-    if longitude is not None:
-        values["longitude"] = longitude
-    if Longitude is not None:
-        values["longitude_mixed"] = Longitude
-    if LONGITUDE is not None:
-        values["longitude_upper"] = LONGITUDE
-
-    if not values:
-        return None
-
-    # Check for conflicts between short and long forms
-    short_values = {
-        v
-        for k, v in values.items()
-        if k.startswith("lon") and not k.startswith("longitude")
-    }
-    long_values = {v for k, v in values.items() if k.startswith("longitude")}
-
-    # If both short and long forms provided with different values, that's a conflict
-    if short_values and long_values and short_values != long_values:
-        raise HTTPException(
-            status_code=400,
-            detail={
-                "error": "Conflicting longitude values provided (lon and longitude)"
-            },
-        )
-
-    # Return first available value with priority
-    if lon is not None:
-        return lon
-    if Lon is not None:
-        return Lon
-    if LON is not None:
-        return LON
-    if longitude is not None:
-        return longitude
-    if Longitude is not None:
-        return Longitude
-    if LONGITUDE is not None:
-        return LONGITUDE
-    return None
+    return parse_coordinates(request.query_params.multi_items())
@@ -0,0 +1,43 @@
+"""Pre-serialized HTTP error responses."""
+
+import orjson
+
+
+def error_body(message: str) -> bytes:
+    """Serialize an error message in the API's error response format.
+
+    Args:
+        message: Human-readable error message
+
+    Returns:
+        JSON-encoded response body
+
+    Example:
+        >>> error_body("Latitude must be a number")
+        b'{"detail":{"error":"Latitude must be a number"}}'
+    """
+    return orjson.dumps({"detail": {"error": message}})
+
+
+class RawHTTPError(Exception):
+    """HTTP error carrying an already serialized JSON body.
+
+    Used for errors with fixed messages, whose bodies are encoded once at
+    import time instead of serializing a detail dict on every raise.
+
+    Example:
+        >>> error = RawHTTPError(400, error_body("Latitude parameter required"))
+        >>> error.status_code
+        400
+    """
+
+    def __init__(self, status_code: int, body: bytes):
+        """Initialize error.
+
+        Args:
+            status_code: HTTP status code
+            body: JSON-encoded response body
+        """
+        super().__init__(status_code)
+        self.status_code = status_code
+        self.body = body
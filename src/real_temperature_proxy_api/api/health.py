@@ -1,7 +1,18 @@
 """Health check endpoints for Kubernetes probes."""
 
+import asyncio
+import math
+import time
+from collections.abc import Awaitable, Callable
+
 from fastapi import APIRouter
-from pydantic import BaseModel
+from loguru import logger
+from pydantic import BaseModel, ConfigDict
+from starlette.routing import Route
+from starlette.types import Receive, Scope, Send
+
+from ..core.cache import weather_cache
+from ..core.config import settings
 
 router = APIRouter()
 
@@ -17,67 +28,175 @@ class HealthResponse(BaseModel):
 
     status: str
 
+    # Instances are shared module-level constants
+    model_config = ConfigDict(frozen=True, extra="forbid")
 
-@router.get(
-    "/health",
-    response_model=HealthResponse,
-    summary="Liveness probe",
-    description="Check if the application process is running",
-    responses={
-        200: {
-            "description": "Application is alive",
-            "content": {"application/json": {"example": {"status": "ok"}}},
-        },
-    },
-)
-async def health_check() -> HealthResponse:
-    """Liveness probe for Kubernetes.
 
-    Always returns 200 OK to indicate the process is running.
-    Does not check external dependencies or service state.
+# Probe responses never change, so they are built and serialized once at import time
+_OK = HealthResponse(status="ok")
+_UNAVAILABLE = HealthResponse(status="unavailable")
+
+_OK_BODY = _OK.model_dump_json().encode()
+_OK_HEADERS = [
+    (b"content-type", b"application/json"),
+    (b"content-length", str(len(_OK_BODY)).encode()),
+]
+
+_UNAVAILABLE_BODY = _UNAVAILABLE.model_dump_json().encode()
+_UNAVAILABLE_HEADERS = [
+    (b"content-type", b"application/json"),
+    (b"content-length", str(len(_UNAVAILABLE_BODY)).encode()),
+]
+
 
-    Returns:
-        Health status response
+class StaticJSONEndpoint:
+    """Raw ASGI endpoint sending a fixed, pre-encoded JSON response.
+
+    Kubernetes probes hit these endpoints several times per second per pod,
+    so they skip the FastAPI request/response cycle entirely (no dependency
+    resolution, model validation, or serialization per call).
 
     Example:
-        >>> # GET /health
-        >>> # Returns: {"status": "ok"}
+        >>> endpoint = StaticJSONEndpoint(b'{"status":"ok"}', _OK_HEADERS)
+        >>> endpoint.body
+        b'{"status":"ok"}'
     """
-    return HealthResponse(status="ok")
-
-
-@router.get(
-    "/ready",
-    response_model=HealthResponse,
-    summary="Readiness probe",
-    description="Check if the application is ready to serve requests",
-    responses={
-        200: {
-            "description": "Application is ready",
-            "content": {"application/json": {"example": {"status": "ok"}}},
-        },
-    },
-)
-async def readiness_check() -> HealthResponse:
-    """Readiness probe for Kubernetes.
 
-    Returns 200 OK when the application is ready to serve requests.
-    Checks internal state (cache initialized, configuration valid).
-    Does NOT actively probe Open-Meteo API.
+    def __init__(self, body: bytes, headers: list[tuple[bytes, bytes]]):
+        """Store the pre-encoded response.
+
+        Args:
+            body: JSON-encoded response body
+            headers: Raw response headers, including content-length
+        """
+        self.body = body
+        self.headers = headers
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Send the fixed response.
+
+        Args:
+            scope: ASGI connection scope
+            receive: ASGI receive callable
+            send: ASGI send callable
+        """
+        await send(
+            {"type": "http.response.start", "status": 200, "headers": self.headers}
+        )
+        await send({"type": "http.response.body", "body": self.body})
+
 
-    Returns:
-        Readiness status response
+async def ping_cache() -> None:
+    """Check that the response cache backend answers lookups.
+
+    Raises:
+        Exception: If the cache backend is not usable
+    """
+    await weather_cache.get("readiness-probe")
+
+
+async def ping_config() -> None:
+    """Check that the loaded configuration is usable.
+
+    Raises:
+        RuntimeError: If required settings are missing
+    """
+    if not settings.OPENMETEO_BASE_URL:
+        raise RuntimeError("OPENMETEO_BASE_URL is not configured")
+
+
+class ReadinessEndpoint:
+    """Raw ASGI readiness probe running internal checks concurrently.
+
+    Checks run together under a single timeout and the outcome is reused for
+    a short interval, so frequent probes never pile up work on the event loop.
+    Open-Meteo is deliberately not checked to avoid cascading failures.
 
     Example:
-        >>> # GET /ready
-        >>> # Returns: {"status": "ok"}
+        >>> endpoint = ReadinessEndpoint(checks=(ping_config,))
+        >>> endpoint.timeout
+        2.0
     """
-    # For now, return OK immediately
-    # In a more complex setup, we'd check:
-    # - Cache backend is initialized
-    # - Configuration is valid
-    # - Internal services are ready
-    #
-    # We don't check:
-    # - Open-Meteo API availability (to avoid cascading failures)
-    return HealthResponse(status="ok")
+
+    def __init__(
+        self,
+        checks: tuple[Callable[[], Awaitable[None]], ...],
+        timeout: float = 2.0,
+        cache_ttl: float = 1.0,
+    ):
+        """Initialize readiness probe.
+
+        Args:
+            checks: Async callables raising an exception when not ready
+            timeout: Maximum time in seconds for all checks together
+            cache_ttl: Seconds to reuse the last outcome
+        """
+        self.checks = checks
+        self.timeout = timeout
+        self.cache_ttl = cache_ttl
+        # (monotonic time of last check, outcome)
+        self._last_check: tuple[float, bool] = (-math.inf, True)
+
+    async def is_ready(self) -> bool:
+        """Run the checks, or return the outcome of a check done recently.
+
+        Returns:
+            True if every check passed within the timeout
+        """
+        now = time.monotonic()
+        checked_at, ready = self._last_check
+        if now - checked_at < self.cache_ttl:
+            return ready
+
+        try:
+            results = await asyncio.wait_for(
+                asyncio.gather(
+                    *(check() for check in self.checks), return_exceptions=True
+                ),
+                timeout=self.timeout,
+            )
+        except TimeoutError:
+            logger.warning("Readiness checks timed out", timeout=self.timeout)
+            ready = False
+        else:
+            failures = [result for result in results if isinstance(result, Exception)]
+            for failure in failures:
+                logger.warning("Readiness check failed", error=str(failure))
+            ready = not failures
+
+        self._last_check = (time.monotonic(), ready)
+        return ready
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Send 200 when ready, 503 otherwise.
+
+        Args:
+            scope: ASGI connection scope
+            receive: ASGI receive callable
+            send: ASGI send callable
+        """
+        if await self.is_ready():
+            status, headers, body = 200, _OK_HEADERS, _OK_BODY
+        else:
+            status, headers, body = 503, _UNAVAILABLE_HEADERS, _UNAVAILABLE_BODY
+        await send(
+            {"type": "http.response.start", "status": status, "headers": headers}
+        )
+        await send({"type": "http.response.body", "body": body})
+
+
+# Liveness probe: always 200 OK while the process is running.
+# Does not check external dependencies or service state.
+health_check = StaticJSONEndpoint(_OK_BODY, _OK_HEADERS)
+
+# Readiness probe: 200 OK when the application is ready to serve requests.
+# We don't check Open-Meteo API availability (to avoid cascading failures)
+readiness_check = ReadinessEndpoint(checks=(ping_cache, ping_config))
+
+# Plain Starlette routes, which call ASGI endpoints directly
+router.routes.append(
+    Route("/health", health_check, methods=["GET"], include_in_schema=False)
+)
+router.routes.append(
+    Route("/ready", readiness_check, methods=["GET"], include_in_schema=False)
+)
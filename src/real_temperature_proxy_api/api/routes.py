@@ -2,25 +2,25 @@
 
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, HTTPException
-from fastapi_cache.decorator import cache
-from loguru import logger
+from fastapi import APIRouter, Depends
 
-from ..core.config import settings
 from ..models.weather import WeatherResponse
 from ..services.weather import weather_service
-from .dependencies import get_latitude_param, get_longitude_param
+from .dependencies import get_coordinates
 
 router = APIRouter()
 
 
 @router.get(
     "/v1/current",
-    response_model=WeatherResponse,
+    # The service already returns a WeatherResponse; skip re-validating it on
+    # every response and reference the model for the OpenAPI schema only
+    response_model=None,
     summary="Get current weather conditions",
     description="Fetch current temperature and wind speed for specified coordinates from Open-Meteo API",
     responses={
         200: {
+            "model": WeatherResponse,
             "description": "Current weather conditions",
             "content": {
                 "application/json": {
@@ -65,24 +65,41 @@ router = APIRouter()
             },
         },
     },
+    # Query parameters are parsed by get_coordinates, so document them here
+    openapi_extra={
+        "parameters": [
+            {
+                "name": "lat",
+                "in": "query",
+                "required": True,
+                "description": "Latitude in decimal degrees, rounded to 2 decimal places (alias: latitude, case-insensitive)",
+                "schema": {"type": "number", "minimum": -90.0, "maximum": 90.0},
+            },
+            {
+                "name": "lon",
+                "in": "query",
+                "required": True,
+                "description": "Longitude in decimal degrees, rounded to 2 decimal places (alias: longitude, case-insensitive)",
+                "schema": {"type": "number", "minimum": -180.0, "maximum": 180.0},
+            },
+        ]
+    },
 )
-@cache(expire=settings.CACHE_TTL)
 async def get_current_weather(
-    latitude_param: Annotated[float | None, Depends(get_latitude_param)],
-    longitude_param: Annotated[float | None, Depends(get_longitude_param)],
+    coordinates: Annotated[tuple[float, float], Depends(get_coordinates)],
 ) -> WeatherResponse:
     """Get current weather conditions for specified coordinates.
 
     Fetches data from Open-Meteo API and returns normalized temperature and wind speed.
-    Results are cached for 60 seconds (configurable) to reduce API calls.
+    Successful responses are cached for 60 seconds (configurable) by
+    WeatherCacheMiddleware, so cache hits never reach this handler.
 
     Query parameters are case-insensitive and support multiple forms:
     - Latitude: lat, latitude, LAT, Lat, LATITUDE, Latitude
     - Longitude: lon, longitude, LON, Lon, LONGITUDE, Longitude
 
     Args:
-        latitude_param: Latitude from case-insensitive query parameter
-        longitude_param: Longitude from case-insensitive query parameter
+        coordinates: (latitude, longitude) from case-insensitive query parameters
 
     Returns:
         Current weather conditions with location, temperature, wind speed, and retrieval time
@@ -95,24 +112,7 @@ async def get_current_weather(
         >>> # GET /v1/current?LAT=52.52&LON=13.41  (case-insensitive)
         >>> # Returns: {"location": {"lat": 52.52, "lon": 13.41}, ...}
     """
-    # Validate required parameters
-    if latitude_param is None:
-        raise HTTPException(
-            status_code=400,
-            detail={"error": "Latitude parameter required (lat or latitude)"},
-        )
-
-    if longitude_param is None:
-        raise HTTPException(
-            status_code=400,
-            detail={"error": "Longitude parameter required (lon or longitude)"},
-        )
-
-    logger.info(
-        "Weather request received",
-        # Note: Coordinates are logged here for debugging, but not in normal operation
-        # to avoid PII concerns (as per decisions.md)
-    )
+    latitude, longitude = coordinates
 
     # Fetch weather (with caching and request coalescing)
-    return await weather_service.get_current_weather(latitude_param, longitude_param)
+    return await weather_service.get_current_weather(latitude, longitude)
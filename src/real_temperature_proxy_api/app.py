@@ -1,78 +1,386 @@
 """Main FastAPI application."""
 
+import math
+import random
+import struct
 import sys
+import time
 from contextlib import asynccontextmanager
+from urllib.parse import parse_qsl
 
-from fastapi import FastAPI, Request, status
-from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
-from starlette.middleware.base import BaseHTTPMiddleware
-from fastapi_cache import FastAPICache
+from fastapi import FastAPI, Request, Response
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
 from loguru import logger
-from opentelemetry import metrics
+from opentelemetry import metrics, trace
 from opentelemetry.exporter.prometheus import PrometheusMetricReader
 from opentelemetry.instrumentation.fastapi import FastAPIInstrumentor
 from opentelemetry.sdk.metrics import MeterProvider
 from opentelemetry.sdk.resources import Resource
 from prometheus_client import REGISTRY, generate_latest
+from starlette.routing import Route, request_response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from .api import health, routes
-from .core.cache import LRUInMemoryBackend
-from .core.config import settings
+from .api.dependencies import parse_coordinates
+from .api.errors import RawHTTPError
+from .core.cache import LRUInMemoryBackend, weather_cache
+from .core.config import LOG_DEBUG, settings
+from .services.weather import weather_service
 
 
-class AcceptHeaderValidationMiddleware(BaseHTTPMiddleware):
-    """Middleware to validate Accept header for JSON-only API.
+# Paths exempt from Accept header validation (health checks, metrics, and docs)
+_ACCEPT_EXEMPT_PATHS = frozenset(
+    {"/health", "/ready", "/metrics", "/docs", "/openapi.json"}
+)
+
+_JSON_HEADERS = [(b"content-type", b"application/json")]
+# CORS for all origins (hardcoded per decisions.md)
+_CORS_ALLOW_ORIGIN = (b"access-control-allow-origin", b"*")
+_CORS_PREFLIGHT_HEADERS = [
+    _CORS_ALLOW_ORIGIN,
+    (b"access-control-allow-methods", b"*"),
+    (b"access-control-allow-headers", b"*"),
+    (b"access-control-max-age", b"600"),
+    (b"content-length", b"0"),
+]
+
+# Cache key: both coordinates packed as two little-endian doubles (16 bytes)
+_pack_coordinates = struct.Struct("<dd").pack
+
+_NOT_ACCEPTABLE_BODY = b'{"error":"This API only returns application/json"}'
+_INTERNAL_ERROR_BODY = b'{"error":"Internal server error"}'
+
+
+async def _send_json(send: Send, status_code: int, body: bytes) -> None:
+    """Send a complete JSON response with a pre-serialized body.
+
+    Args:
+        send: ASGI send callable
+        status_code: HTTP status code
+        body: JSON-encoded response body
+    """
+    await send(
+        {
+            "type": "http.response.start",
+            "status": status_code,
+            "headers": [
+                *_JSON_HEADERS,
+                (b"content-length", str(len(body)).encode()),
+            ],
+        }
+    )
+    await send({"type": "http.response.body", "body": body})
+
+
+class FastCORSMiddleware:
+    """Pure ASGI middleware allowing cross-origin requests from any origin.
+
+    The policy is fixed (all origins, methods, and headers, no credentials),
+    so preflight responses and the allow-origin header are constant tuples
+    instead of being matched and built per request.
+    """
+
+    def __init__(self, app: ASGIApp):
+        """Wrap the next ASGI application.
+
+        Args:
+            app: The next ASGI application in the stack
+        """
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Answer preflight requests or add CORS headers to the response.
+
+        Args:
+            scope: ASGI connection scope
+            receive: ASGI receive callable
+            send: ASGI send callable
+        """
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        if scope["method"] == "OPTIONS" and any(
+            name == b"access-control-request-method" for name, _ in scope["headers"]
+        ):
+            await send(
+                {
+                    "type": "http.response.start",
+                    "status": 200,
+                    "headers": _CORS_PREFLIGHT_HEADERS,
+                }
+            )
+            await send({"type": "http.response.body", "body": b""})
+            return
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                # New message, so inner middleware holding the original is unaffected
+                message = {
+                    **message,
+                    "headers": [*message.get("headers", ()), _CORS_ALLOW_ORIGIN],
+                }
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
+
+
+class AcceptHeaderValidationMiddleware:
+    """Pure ASGI middleware to validate Accept header for JSON-only API.
 
     Validates that requests accept application/json responses.
     Allows requests without Accept header or with */*, application/*, or application/json.
     """
 
-    async def dispatch(self, request: Request, call_next):
-        """Validate Accept header before processing request.
+    def __init__(self, app: ASGIApp):
+        """Wrap the next ASGI application.
 
         Args:
-            request: The incoming request
-            call_next: The next middleware/handler
+            app: The next ASGI application in the stack
+        """
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Validate Accept header before processing request.
 
-        Returns:
-            Response from next handler or 406 error
+        Args:
+            scope: ASGI connection scope
+            receive: ASGI receive callable
+            send: ASGI send callable
         """
-        # Skip validation for health checks, metrics, and docs
-        if request.url.path in [
-            "/health",
-            "/ready",
-            "/metrics",
-            "/docs",
-            "/openapi.json",
-        ]:
-            return await call_next(request)
-
-        # Get Accept header
-        accept_header = request.headers.get("accept", "*/*")
+        if scope["type"] != "http" or scope["path"] in _ACCEPT_EXEMPT_PATHS:
+            await self.app(scope, receive, send)
+            return
+
+        # Get Accept header (header names are lowercase in ASGI)
+        accept_header = b"*/*"
+        for name, value in scope["headers"]:
+            if name == b"accept":
+                accept_header = value
+                break
 
         # Check if JSON is acceptable
-        accepts_json = (
-            "*/*" in accept_header
-            or "application/*" in accept_header
-            or "application/json" in accept_header
-        )
+        if (
+            b"*/*" in accept_header
+            or b"application/*" in accept_header
+            or b"application/json" in accept_header
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        await _send_json(send, 406, _NOT_ACCEPTABLE_BODY)
+
+
+class ASGIErrorMiddleware:
+    """Pure ASGI middleware handling unhandled errors.
+
+    Logs the exception and returns a generic error response to avoid
+    exposing internal details to clients. Unlike BaseHTTPMiddleware it adds
+    no per-request Request/Response objects or memory streams.
+    """
+
+    def __init__(self, app: ASGIApp):
+        """Wrap the next ASGI application.
+
+        Args:
+            app: The next ASGI application in the stack
+        """
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Run the request and turn unhandled exceptions into a 500 response.
+
+        If the response has already started, the exception is re-raised
+        because the status line can no longer be changed.
+
+        Args:
+            scope: ASGI connection scope
+            receive: ASGI receive callable
+            send: ASGI send callable
+        """
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        response_started = False
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal response_started
+            if message["type"] == "http.response.start":
+                response_started = True
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        except Exception:
+            logger.exception(
+                "Unhandled exception",
+                path=scope["path"],
+                method=scope["method"],
+            )
+            if response_started:
+                raise
+            await _send_json(send, 500, _INTERNAL_ERROR_BODY)
+
+
+class WeatherCacheMiddleware:
+    """Pure ASGI middleware caching successful /v1/current responses.
+
+    Cache hits are answered with the stored status headers and body bytes
+    before routing, dependency resolution, or serialization run. Misses go
+    through the application and 200 responses are stored for ttl seconds.
+    Requests with invalid coordinates are passed through so the route
+    produces the error response.
+
+    Example:
+        >>> backend = LRUInMemoryBackend(max_size=100)
+        >>> middleware = WeatherCacheMiddleware(app, backend=backend, ttl=60)
+    """
+
+    def __init__(self, app: ASGIApp, backend: LRUInMemoryBackend, ttl: int):
+        """Wrap the next ASGI application.
+
+        Args:
+            app: The next ASGI application in the stack
+            backend: Cache backend storing (headers, body) entries
+            ttl: Time to live of cached responses in seconds
+        """
+        self.app = app
+        self.backend = backend
+        self.ttl = ttl
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Serve the response from cache or cache the application's response.
 
-        if not accepts_json:
-            return JSONResponse(
-                status_code=status.HTTP_406_NOT_ACCEPTABLE,
-                content={"error": "This API only returns application/json"},
+        Args:
+            scope: ASGI connection scope
+            receive: ASGI receive callable
+            send: ASGI send callable
+        """
+        if (
+            scope["type"] != "http"
+            or scope["method"] != "GET"
+            or scope["path"] != "/v1/current"
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        try:
+            latitude, longitude = parse_coordinates(
+                parse_qsl(
+                    scope["query_string"].decode("latin-1"), keep_blank_values=True
+                )
+            )
+        except RawHTTPError:
+            await self.app(scope, receive, send)
+            return
+
+        # Coordinates are already rounded, so nearby requests share an entry
+        key = _pack_coordinates(latitude, longitude)
+        # The backend is in memory: use its sync API instead of awaiting
+        entry = self.backend.get_sync(key)
+        if entry is not None:
+            headers, body = entry
+            await send(
+                {"type": "http.response.start", "status": 200, "headers": headers}
+            )
+            await send({"type": "http.response.body", "body": body})
+            return
+
+        start_message: Message | None = None
+        chunks: list[bytes] = []
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal start_message
+            if message["type"] == "http.response.start":
+                start_message = message
+            elif message["type"] == "http.response.body":
+                chunks.append(message.get("body", b""))
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
+
+        if start_message is not None and start_message["status"] == 200:
+            self.backend.set_sync(
+                key,
+                (list(start_message["headers"]), b"".join(chunks)),
+                self.ttl,
             )
 
-        return await call_next(request)
+
+class SampledTelemetryMiddleware:
+    """Pure ASGI middleware with lightweight request telemetry.
+
+    Replaces FastAPIInstrumentor outside debug mode: every request records
+    its duration in the http.server.duration histogram, but only a sampled
+    fraction of requests gets a tracing span.
+    """
+
+    def __init__(self, app: ASGIApp, sample_rate: float = 0.01):
+        """Wrap the next ASGI application.
+
+        Args:
+            app: The next ASGI application in the stack
+            sample_rate: Fraction of requests traced with a span (0.0-1.0)
+        """
+        self.app = app
+        self.sample_rate = sample_rate
+        self.tracer = trace.get_tracer(__name__)
+        self.duration = metrics.get_meter(__name__).create_histogram(
+            "http.server.duration",
+            unit="ms",
+            description="Duration of inbound HTTP requests",
+        )
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Record request duration and trace sampled requests.
+
+        Args:
+            scope: ASGI connection scope
+            receive: ASGI receive callable
+            send: ASGI send callable
+        """
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status_code = 500
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        start = time.perf_counter()
+        try:
+            if random.random() < self.sample_rate:  # nosec B311 - sampling only
+                with self.tracer.start_as_current_span(
+                    f"{scope['method']} {scope['path']}",
+                    kind=trace.SpanKind.SERVER,
+                ) as span:
+                    await self.app(scope, receive, send_wrapper)
+                    span.set_attribute("http.status_code", status_code)
+            else:
+                await self.app(scope, receive, send_wrapper)
+        finally:
+            self.duration.record(
+                (time.perf_counter() - start) * 1000,
+                {"http.method": scope["method"], "http.status_code": status_code},
+            )
 
 
 def setup_logging():
     """Configure loguru for structured logging.
 
     Sets up logging with the configured log level from settings.
-    Logs are written to stderr with structured format.
+    Logs are written to stderr with structured format. Exception
+    introspection (backtrace, variable values) is disabled in production,
+    and colors are only used when stderr is a terminal.
     """
+    is_production = settings.ENVIRONMENT.lower() == "production"
+
     # Remove default handler
     logger.remove()
 
@@ -82,9 +390,9 @@ def setup_logging():
         format="<green>{time:YYYY-MM-DD HH:mm:ss.SSS}</green> | <level>{level: <8}</level> | <cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> - <level>{message}</level> | {extra}",
         level=settings.LOG_LEVEL,
         serialize=False,  # Human-readable format
-        colorize=True,
-        backtrace=True,
-        diagnose=True,
+        colorize=sys.stderr.isatty(),
+        backtrace=not is_production,
+        diagnose=not is_production,  # Also avoids leaking variable values
     )
 
     logger.info(
@@ -127,8 +435,8 @@ async def lifespan(app: FastAPI):
     """Application lifespan manager.
 
     Handles startup and shutdown events:
-    - Startup: Initialize cache, log configuration
-    - Shutdown: Cleanup resources
+    - Startup: Log configuration, open the shared upstream HTTP client
+    - Shutdown: Close the upstream HTTP client
 
     Args:
         app: FastAPI application instance
@@ -156,12 +464,9 @@ async def lifespan(app: FastAPI):
         # Do NOT log API key
     )
 
-    # Initialize cache with LRU eviction
-    FastAPICache.init(
-        LRUInMemoryBackend(max_size=settings.CACHE_MAX_SIZE),
-        prefix="weather-cache:",
-    )
-    logger.info("Cache initialized", max_size=settings.CACHE_MAX_SIZE)
+    # Open pooled keep-alive connections for upstream requests
+    await weather_service.start()
+    logger.info("Upstream HTTP client started")
 
     # Application is now ready
     logger.info("Application ready to serve requests")
@@ -170,6 +475,7 @@ async def lifespan(app: FastAPI):
 
     # Shutdown
     logger.info("Shutting down Real Temperature Proxy API")
+    await weather_service.close()
 
 
 # Set up logging first
@@ -184,36 +490,87 @@ app = FastAPI(
     description="REST API that fetches current temperature data from Open-Meteo and returns normalized responses",
     version="0.1.0",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,  # orjson instead of stdlib json
     docs_url="/docs"
     if settings.ENVIRONMENT.lower() != "production"
     else None,  # Swagger UI in development/staging only
     redoc_url=None,  # Disable ReDoc
 )
 
-# Set up CORS
+# Cache weather responses innermost, so hits still get CORS headers
 app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["*"],  # Allow all origins
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    WeatherCacheMiddleware,
+    backend=weather_cache,
+    ttl=settings.CACHE_TTL,
 )
 
+# Set up CORS (all origins; credentials are not allowed with "*")
+app.add_middleware(FastCORSMiddleware)
+
 # Add Accept header validation middleware
 app.add_middleware(AcceptHeaderValidationMiddleware)
 
+
+@app.exception_handler(RawHTTPError)
+async def raw_http_error_handler(request: Request, exc: RawHTTPError) -> Response:
+    """Send the pre-serialized body of a RawHTTPError.
+
+    Args:
+        request: The request that failed
+        exc: The raised error
+
+    Returns:
+        JSON response with the error's status code and body
+    """
+    return Response(
+        content=exc.body,
+        status_code=exc.status_code,
+        media_type="application/json",
+    )
+
+
 # Include routers
 app.include_router(health.router, tags=["Health"])
 app.include_router(routes.router, tags=["Weather"])
 
 
+# Prometheus text exposition format produced by generate_latest
+_METRICS_MEDIA_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+_METRICS_HEADERS = {"Cache-Control": "no-cache"}
+
+# Last exposition and when it was generated (monotonic clock)
+_metrics_cache: tuple[float, bytes] = (-math.inf, b"")
+
+
+def _metrics_body() -> bytes:
+    """Get the Prometheus exposition, regenerated at most once per second.
+
+    generate_latest walks the whole registry, so scrapes arriving within a
+    second of each other (e.g. several Prometheus replicas) share one result.
+
+    Returns:
+        Prometheus text exposition
+    """
+    global _metrics_cache
+    generated_at, body = _metrics_cache
+    now = time.monotonic()
+    if now - generated_at >= 1.0:
+        body = generate_latest(REGISTRY)
+        _metrics_cache = (now, body)
+    return body
+
+
 # Metrics endpoint
-@app.get("/metrics", include_in_schema=False)
-async def metrics_endpoint():
+async def metrics_endpoint(request: Request) -> Response:
     """Prometheus metrics endpoint.
 
     Exposes OpenTelemetry metrics in Prometheus format for scraping.
-    This endpoint is open to everyone (no authentication).
+    This endpoint is open to everyone (no authentication). Registered as a
+    plain Starlette route and returns the exposition bytes as-is; the
+    exposition is regenerated at most once per second.
+
+    Args:
+        request: The incoming request
 
     Returns:
         Prometheus-formatted metrics
@@ -222,40 +579,35 @@ async def metrics_endpoint():
         >>> # GET /metrics
         >>> # Returns: Prometheus metrics in text format
     """
-    return JSONResponse(
-        content=generate_latest(REGISTRY).decode("utf-8"),
-        media_type="text/plain",
+    return Response(
+        content=_metrics_body(),
+        media_type=_METRICS_MEDIA_TYPE,
+        headers=_METRICS_HEADERS,
     )
 
 
-# Global exception handler
-@app.exception_handler(Exception)
-async def global_exception_handler(request: Request, exc: Exception):
-    """Global exception handler for unhandled errors.
-
-    Logs the exception and returns a generic error response to avoid
-    exposing internal details to clients.
-
-    Args:
-        request: The incoming request
-        exc: The unhandled exception
-
-    Returns:
-        JSON error response with 500 status code
-    """
-    logger.exception(
-        "Unhandled exception",
-        path=request.url.path,
-        method=request.method,
+# Scrapes are gzip-compressed when the scraper accepts it (the exposition is
+# several KB). Weather responses are far below the 512-byte threshold, so the
+# API itself is left without a compression layer.
+app.router.routes.append(
+    Route(
+        "/metrics",
+        GZipMiddleware(request_response(metrics_endpoint), minimum_size=512),
+        methods=["GET"],
+        include_in_schema=False,
     )
+)
 
-    return JSONResponse(
-        status_code=500,
-        content={"error": "Internal server error"},
-    )
 
+# Instrument with OpenTelemetry: full instrumentation only when debugging,
+# sampled spans and a duration histogram otherwise
+if LOG_DEBUG:
+    FastAPIInstrumentor.instrument_app(app)
+else:
+    app.add_middleware(SampledTelemetryMiddleware)
 
-# Instrument with OpenTelemetry
-FastAPIInstrumentor.instrument_app(app)
+# Handle unhandled errors outermost (added last) so failures in the other
+# middleware, telemetry included, are covered
+app.add_middleware(ASGIErrorMiddleware)
 
 logger.info("FastAPI application created")
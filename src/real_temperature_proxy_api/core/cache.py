@@ -1,16 +1,28 @@
-"""Custom LRU cache backend for fastapi-cache2 with size limits."""
+"""In-memory LRU cache backend with size limits."""
 
-from collections import OrderedDict
+import math
+import time
 from typing import Any
 
-from fastapi_cache.backends.inmemory import InMemoryBackend
+from .config import settings
 
+# Keys of the sync API may also be bytes (e.g. packed coordinates), which
+# skips encoding them as text
+CacheKey = str | bytes
 
-class LRUInMemoryBackend(InMemoryBackend):
+
+class LRUInMemoryBackend:
     """In-memory cache backend with LRU eviction and max size limit.
 
     When the cache reaches max_size, the least recently used (LRU) entry
-    is evicted to make room for new entries.
+    is evicted to make room for new entries. Entries expire after their TTL;
+    expired entries are dropped lazily when looked up.
+
+    Recency is tracked with the clock (second-chance) approximation of LRU:
+    entries live in slots (added on demand up to max_size, then reused), a
+    hit only sets the slot's reference bit, and eviction advances a hand past
+    referenced slots (clearing their bits) to the first unreferenced one.
+    Hits never reorder anything.
 
     Example:
         >>> cache = LRUInMemoryBackend(max_size=3)
@@ -28,10 +40,52 @@ class LRUInMemoryBackend(InMemoryBackend):
             >>> cache.max_size
             100
         """
-        super().__init__()
         self.max_size = max_size
-        # Replace the default dict with OrderedDict for LRU tracking
-        self._store: OrderedDict[str, Any] = OrderedDict()
+        self._reset()
+
+    def _reset(self) -> None:
+        """Drop all slots; they are added again on demand up to max_size."""
+        # Key -> slot index
+        self._index: dict[CacheKey, int] = {}
+        self._keys: list[CacheKey | None] = []
+        # (value, expires_at) with expires_at on the monotonic clock
+        self._entries: list[tuple[Any, float] | None] = []
+        self._referenced = bytearray()
+        # Released slots, reused before new ones are added
+        self._free: list[int] = []
+        self._hand = 0
+
+    def _release(self, key: CacheKey, slot: int) -> None:
+        """Remove a key and return its slot to the free list.
+
+        Args:
+            key: Cache key stored in the slot
+            slot: Slot index
+        """
+        del self._index[key]
+        self._keys[slot] = None
+        self._entries[slot] = None
+        self._referenced[slot] = 0
+        self._free.append(slot)
+
+    def _lookup(self, key: CacheKey) -> tuple[int, tuple[Any, float]] | None:
+        """Find a live entry and mark it as recently used.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            (slot, (value, expires_at)) or None if not found or expired
+        """
+        slot = self._index.get(key)
+        if slot is None:
+            return None
+        entry = self._entries[slot]
+        if entry is None or entry[1] <= time.monotonic():
+            self._release(key, slot)
+            return None
+        self._referenced[slot] = 1
+        return slot, entry
 
     async def get(self, key: str) -> Any:
         """Get value from cache and mark as recently used.
@@ -40,7 +94,7 @@ class LRUInMemoryBackend(InMemoryBackend):
             key: Cache key
 
         Returns:
-            Cached value or None if not found
+            Cached value or None if not found or expired
 
         Example:
             >>> cache = LRUInMemoryBackend(max_size=3)
@@ -49,21 +103,39 @@ class LRUInMemoryBackend(InMemoryBackend):
             >>> asyncio.run(cache.get("key1"))
             'value1'
         """
-        if key in self._store:
-            # Move to end (most recently used)
-            self._store.move_to_end(key)
-            return self._store[key]
-        return None
+        return self.get_sync(key)
+
+    def get_sync(self, key: CacheKey) -> Any:
+        """Get value from cache without going through a coroutine.
+
+        Same as get(); the backend does no I/O, so callers on the request
+        path can skip the await.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached value or None if not found or expired
+
+        Example:
+            >>> cache = LRUInMemoryBackend(max_size=3)
+            >>> cache.set_sync("key1", "value1", 60)
+            >>> cache.get_sync("key1")
+            'value1'
+        """
+        found = self._lookup(key)
+        return None if found is None else found[1][0]
 
     async def set(self, key: str, value: Any, expire: int | None = None) -> None:
         """Set value in cache with LRU eviction if needed.
 
-        If cache is at max_size, evicts the least recently used entry.
+        If cache is at max_size, evicts an entry not used since the clock
+        hand last passed it.
 
         Args:
             key: Cache key
             value: Value to cache
-            expire: TTL in seconds (not used by this backend, handled by fastapi-cache2)
+            expire: TTL in seconds (None or 0 means the entry never expires)
 
         Example:
             >>> cache = LRUInMemoryBackend(max_size=2)
@@ -73,16 +145,57 @@ class LRUInMemoryBackend(InMemoryBackend):
             >>> asyncio.run(cache.set("c", 3, 60))  # Evicts "a"
             >>> asyncio.run(cache.get("a"))  # Returns None
         """
-        # Check if we need to evict before adding
-        if key not in self._store and len(self._store) >= self.max_size:
-            # Evict least recently used (first item)
-            evicted_key = next(iter(self._store))
-            del self._store[evicted_key]
+        self.set_sync(key, value, expire)
+
+    def set_sync(self, key: CacheKey, value: Any, expire: int | None = None) -> None:
+        """Set value in cache without going through a coroutine.
+
+        Same as set(); see get_sync().
+
+        Args:
+            key: Cache key
+            value: Value to cache
+            expire: TTL in seconds (None or 0 means the entry never expires)
+
+        Example:
+            >>> cache = LRUInMemoryBackend(max_size=1)
+            >>> cache.set_sync("a", 1, 60)
+            >>> cache.set_sync("b", 2, 60)  # Evicts "a"
+            >>> cache.get_sync("a")  # Returns None
+        """
+        entry = (value, time.monotonic() + expire if expire else math.inf)
+        slot = self._index.get(key)
+        if slot is not None:
+            # Update and mark as recently used
+            self._entries[slot] = entry
+            self._referenced[slot] = 1
+            return
 
-        # Add or update (move to end if exists)
-        self._store[key] = value
-        if key in self._store:
-            self._store.move_to_end(key)
+        if self._free:
+            slot = self._free.pop()
+        elif len(self._keys) < self.max_size:
+            slot = len(self._keys)
+            self._keys.append(None)
+            self._entries.append(None)
+            self._referenced.append(0)
+        else:
+            # Evict: give referenced slots a second chance until an
+            # unreferenced one comes up
+            referenced = self._referenced
+            max_size = self.max_size
+            hand = self._hand
+            while referenced[hand]:
+                referenced[hand] = 0
+                hand = (hand + 1) % max_size
+            slot = hand
+            self._hand = (hand + 1) % max_size
+            evicted_key = self._keys[slot]
+            if evicted_key is not None:
+                del self._index[evicted_key]
+
+        self._index[key] = slot
+        self._keys[slot] = key
+        self._entries[slot] = entry
 
     async def delete(self, key: str) -> None:
         """Delete key from cache.
@@ -97,15 +210,29 @@ class LRUInMemoryBackend(InMemoryBackend):
             >>> asyncio.run(cache.delete("key1"))
             >>> asyncio.run(cache.get("key1"))
         """
-        if key in self._store:
-            del self._store[key]
+        self.delete_sync(key)
+
+    def delete_sync(self, key: CacheKey) -> None:
+        """Delete key from cache without going through a coroutine.
+
+        Args:
+            key: Cache key to delete
 
-    async def clear(self, namespace: str | None = None, key: str | None = None) -> None:
+        Example:
+            >>> cache = LRUInMemoryBackend(max_size=3)
+            >>> cache.set_sync("key1", "value1", 60)
+            >>> cache.delete_sync("key1")
+            >>> cache.get_sync("key1")
+        """
+        slot = self._index.get(key)
+        if slot is not None:
+            self._release(key, slot)
+
+    async def clear(self, key: str | None = None) -> None:
         """Clear cache entries.
 
         Args:
-            namespace: Namespace prefix to clear (not implemented)
-            key: Specific key to clear
+            key: Specific key to clear (default: clear everything)
 
         Example:
             >>> cache = LRUInMemoryBackend(max_size=3)
@@ -115,9 +242,9 @@ class LRUInMemoryBackend(InMemoryBackend):
             >>> asyncio.run(cache.get("a"))
         """
         if key:
-            await self.delete(key)
+            self.delete_sync(key)
         else:
-            self._store.clear()
+            self._reset()
 
     def size(self) -> int:
         """Get current cache size.
@@ -132,4 +259,8 @@ class LRUInMemoryBackend(InMemoryBackend):
             >>> cache.size()
             1
         """
-        return len(self._store)
+        return len(self._index)
+
+
+# Global response cache for /v1/current
+weather_cache = LRUInMemoryBackend(max_size=settings.CACHE_MAX_SIZE)
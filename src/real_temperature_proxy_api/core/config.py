@@ -1,8 +1,13 @@
 """Application configuration using Pydantic Settings."""
 
+import os
+from dataclasses import dataclass
+
 from pydantic import Field, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+_VALID_LOG_LEVELS = frozenset({"DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"})
+
 
 class Settings(BaseSettings):
     """Application settings loaded from environment variables.
@@ -123,10 +128,11 @@ class Settings(BaseSettings):
             >>> Settings(LOG_LEVEL="DEBUG").LOG_LEVEL
             'DEBUG'
         """
-        valid_levels = {"DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"}
         v_upper = v.upper()
-        if v_upper not in valid_levels:
-            raise ValueError(f"LOG_LEVEL must be one of {valid_levels}, got {v}")
+        if v_upper not in _VALID_LOG_LEVELS:
+            raise ValueError(
+                f"LOG_LEVEL must be one of {sorted(_VALID_LOG_LEVELS)}, got {v}"
+            )
         return v_upper
 
     @field_validator("OPENMETEO_BASE_URL")
@@ -149,9 +155,64 @@ class Settings(BaseSettings):
         """
         if not v.startswith(("http://", "https://")):
             raise ValueError("OPENMETEO_BASE_URL must start with http:// or https://")
-        # Remove trailing slash for consistency
-        return v.rstrip("/")
+        # Remove trailing slashes for consistency, copying only if there are any
+        return v.rstrip("/") if v.endswith("/") else v
+
+
+@dataclass(frozen=True, slots=True)
+class RuntimeSettings:
+    """Immutable snapshot of validated settings used at runtime.
+
+    Settings are validated once by the Settings model and then copied into
+    this slotted dataclass, which is cheaper to read on request paths and
+    cannot be changed after startup.
+
+    Example:
+        >>> runtime = RuntimeSettings(**Settings(PORT=3000).model_dump())
+        >>> runtime.PORT
+        3000
+    """
+
+    UPSTREAM_TIMEOUT: float
+    OPENMETEO_BASE_URL: str
+    OPENMETEO_API_KEY: str | None
+    RETRY_COUNT: int
+    RETRY_DELAY: int
+    RETRY_BACKOFF_MULTIPLIER: float
+    CACHE_TTL: int
+    CACHE_MAX_SIZE: int
+    REQUEST_COALESCE_LIMIT: int
+    PORT: int
+    LOG_LEVEL: str
+    ENVIRONMENT: str
+
+
+def load_settings() -> RuntimeSettings:
+    """Validate settings from the environment and freeze them.
+
+    The .env file is a development convenience and is not read when
+    ENVIRONMENT=production is set in the process environment.
+
+    Returns:
+        Validated runtime settings
+
+    Raises:
+        ValidationError: If any setting is invalid
+
+    Example:
+        >>> load_settings().CACHE_TTL >= 1
+        True
+    """
+    if os.environ.get("ENVIRONMENT", "").lower() == "production":
+        validated = Settings(_env_file=None)  # type: ignore[call-arg]
+    else:
+        validated = Settings()
+    return RuntimeSettings(**validated.model_dump())
 
 
 # Global settings instance
-settings = Settings()
+settings = load_settings()
+
+# Debug calls on the request path are skipped entirely unless debug logging
+# is configured, so their arguments are never built
+LOG_DEBUG = settings.LOG_LEVEL == "DEBUG"
@@ -1,10 +1,22 @@
-"""Weather data models for request/response handling."""
+"""Weather data models for request/response handling.
+
+All models set defer_build=True, so their validators and serializers are
+built on first use instead of at import.
+"""
 
 from datetime import datetime
 from typing import Literal
 
 from pydantic import BaseModel, ConfigDict, Field, field_validator
 
+# Coalesced requests share one WeatherResponse instance, so it and its nested
+# models must not be mutated
+_RESPONSE_CONFIG = ConfigDict(defer_build=True, frozen=True, extra="forbid")
+
+# Open-Meteo may add fields at any time, so unknown ones are ignored rather
+# than forbidden
+_UPSTREAM_CONFIG = ConfigDict(defer_build=True, frozen=True)
+
 
 class LocationModel(BaseModel):
     """Location coordinates.
@@ -30,6 +42,8 @@ class LocationModel(BaseModel):
         le=180.0,
     )
 
+    model_config = _RESPONSE_CONFIG
+
     @field_validator("lat", "lon")
     @classmethod
     def validate_precision(cls, v: float) -> float:
@@ -48,14 +62,10 @@ class LocationModel(BaseModel):
             >>> LocationModel(lat=52.123456, lon=13.123456)
             LocationModel(lat=52.123456, lon=13.123456)
         """
-        # Check if more than 6 decimal places
-        str_val = f"{v:.10f}".rstrip("0")
-        if "." in str_val:
-            decimals = len(str_val.split(".")[1])
-            if decimals > 6:
-                raise ValueError(
-                    f"Coordinate precision must not exceed 6 decimal places, got {decimals}"
-                )
+        # round() is correctly rounded, so it returns v unchanged exactly when
+        # v has at most 6 decimal places (no string formatting needed)
+        if round(v, 6) != v:
+            raise ValueError("Coordinate precision must not exceed 6 decimal places")
         return v
 
 
@@ -79,6 +89,8 @@ class CurrentWeatherModel(BaseModel):
         description="Wind speed in km/h (1 decimal place)",
     )
 
+    model_config = _RESPONSE_CONFIG
+
 
 class WeatherResponse(BaseModel):
     """Normalized weather response returned to clients.
@@ -106,11 +118,7 @@ class WeatherResponse(BaseModel):
         description="ISO 8601 UTC timestamp when data was originally fetched",
     )
 
-    model_config = ConfigDict(
-        json_encoders={
-            datetime: lambda v: v.isoformat(),
-        }
-    )
+    model_config = _RESPONSE_CONFIG
 
 
 class OpenMeteoCurrentUnits(BaseModel):
@@ -121,6 +129,8 @@ class OpenMeteoCurrentUnits(BaseModel):
     temperature_2m: str
     wind_speed_10m: str
 
+    model_config = _UPSTREAM_CONFIG
+
 
 class OpenMeteoCurrentData(BaseModel):
     """Current weather data from Open-Meteo API.
@@ -141,10 +151,15 @@ class OpenMeteoCurrentData(BaseModel):
     temperature_2m: float | None = None
     wind_speed_10m: float | None = None
 
+    model_config = _UPSTREAM_CONFIG
+
 
 class OpenMeteoResponse(BaseModel):
     """Full response from Open-Meteo API.
 
+    Documents the upstream schema. The client does not build this model on
+    the request path; it reads only the two current values it needs.
+
     Example:
         >>> response = OpenMeteoResponse(
         ...     latitude=52.52,
@@ -180,3 +195,5 @@ class OpenMeteoResponse(BaseModel):
     elevation: float
     current_units: OpenMeteoCurrentUnits
     current: OpenMeteoCurrentData
+
+    model_config = _UPSTREAM_CONFIG
@@ -1,22 +1,22 @@
 """Open-Meteo API client service with retry logic."""
 
+import asyncio
+import random
+import socket
+import time
 from datetime import datetime, timezone
+from types import TracebackType
+from typing import Self
+from urllib.parse import urlencode
 
 import httpx
+import orjson
 from loguru import logger
-from tenacity import (
-    retry,
-    retry_if_exception,
-    stop_after_attempt,
-    wait_exponential,
-    wait_random,
-)
 
-from ..core.config import settings
+from ..core.config import LOG_DEBUG, settings
 from ..models.weather import (
     CurrentWeatherModel,
     LocationModel,
-    OpenMeteoResponse,
     WeatherResponse,
 )
 
@@ -39,6 +39,12 @@ class OpenMeteoUpstreamError(OpenMeteoError):
     pass
 
 
+class OpenMeteoPayloadError(OpenMeteoUpstreamError):
+    """Raised when Open-Meteo returns a 2xx response with an unusable payload."""
+
+    pass
+
+
 class OpenMeteoClientError(OpenMeteoError):
     """Raised when Open-Meteo API returns 4xx error."""
 
@@ -51,6 +57,38 @@ class OpenMeteoNetworkError(OpenMeteoError):
     pass
 
 
+def _is_dns_failure(exception: BaseException) -> bool:
+    """Check whether a connection error was caused by hostname resolution.
+
+    httpx wraps the socket.gaierror raised by the resolver (via httpcore), so
+    the cause chain is walked instead of matching the error message.
+
+    Args:
+        exception: The connection error to check
+
+    Returns:
+        True if a socket.gaierror is in the cause chain, False otherwise
+
+    Example:
+        >>> error = httpx.ConnectError("Name or service not known")
+        >>> error.__cause__ = socket.gaierror(-2, "Name or service not known")
+        >>> _is_dns_failure(error)
+        True
+        >>> _is_dns_failure(httpx.ConnectError("All connection attempts failed"))
+        False
+    """
+    cause: BaseException | None = exception
+    while cause is not None:
+        if isinstance(cause, socket.gaierror):
+            return True
+        cause = cause.__cause__ or cause.__context__
+    return False
+
+
+# Upper bound for a single backoff delay, in seconds
+_MAX_RETRY_DELAY = 30.0
+
+
 def _should_retry(exception: BaseException) -> bool:
     """Determine if an exception should trigger a retry.
 
@@ -61,6 +99,7 @@ def _should_retry(exception: BaseException) -> bool:
 
     Do NOT retry on:
     - 4xx errors (client errors)
+    - Invalid or incomplete payloads in successful responses
     - DNS failures
     - Network errors (general)
 
@@ -77,7 +116,11 @@ def _should_retry(exception: BaseException) -> bool:
         False
         >>> _should_retry(OpenMeteoUpstreamError())
         True
+        >>> _should_retry(OpenMeteoPayloadError())
+        False
     """
+    if isinstance(exception, OpenMeteoPayloadError):
+        return False
     return isinstance(
         exception,
         (
@@ -88,12 +131,136 @@ def _should_retry(exception: BaseException) -> bool:
     )
 
 
+def _is_measurement(value: object) -> bool:
+    """Check that an upstream measurement is a JSON number or null.
+
+    JSON booleans decode to bool, a subclass of int, so they are rejected
+    explicitly.
+
+    Args:
+        value: Measurement from the upstream response
+
+    Returns:
+        True if the value is None, an int or a float (but not a bool)
+
+    Example:
+        >>> _is_measurement(1.5), _is_measurement(3), _is_measurement(None)
+        (True, True, True)
+        >>> _is_measurement("1.5"), _is_measurement(True), _is_measurement({})
+        (False, False, False)
+    """
+    return value is None or (
+        isinstance(value, (int, float)) and not isinstance(value, bool)
+    )
+
+
+def _round1(value: float | None) -> float | None:
+    """Round a measurement to 1 decimal place, passing None through.
+
+    Uses Python's round(), i.e. banker's rounding (see docs/decisions.md).
+    The value is converted with float() first, so integers from the upstream
+    JSON become floats; check the value with _is_measurement() beforehand.
+
+    Args:
+        value: Measurement from the upstream response, if present
+
+    Returns:
+        Rounded value, or None if the value is missing
+
+    Example:
+        >>> _round1(9.76543)
+        9.8
+        >>> _round1(0.25)
+        0.2
+        >>> _round1(3)
+        3.0
+        >>> _round1(None) is None
+        True
+    """
+    return None if value is None else round(float(value), 1)
+
+
+# Last retrievedAt timestamp and the Unix second it was built for
+_now_cache: tuple[int, datetime] = (-1, datetime.min.replace(tzinfo=timezone.utc))
+
+
+def _now_utc() -> datetime:
+    """Get the current UTC time truncated to whole seconds.
+
+    retrievedAt only needs second precision, so the timezone-aware datetime
+    is rebuilt only when the Unix second changes and reused otherwise. It
+    serializes as e.g. "2026-01-20T10:12:54Z" and lags real time by less
+    than one second.
+
+    Returns:
+        Timezone-aware UTC datetime less than one second old
+
+    Example:
+        >>> _now_utc().tzinfo
+        datetime.timezone.utc
+        >>> _now_utc().microsecond
+        0
+    """
+    global _now_cache
+    second = int(time.time())
+    if second != _now_cache[0]:
+        _now_cache = (second, datetime.fromtimestamp(second, timezone.utc))
+    return _now_cache[1]
+
+
+def create_http_client() -> httpx.AsyncClient:
+    """Create an HTTP client for Open-Meteo requests.
+
+    Connections are kept alive so repeated requests skip the TCP and TLS
+    handshakes.
+
+    UPSTREAM_TIMEOUT is split per phase: connecting gets at most 0.3s (a third
+    of the budget for small budgets), so an unreachable host fails fast and
+    the retry gets a chance. Writing the small GET request gets at most 0.2s
+    and waiting for a pooled connection at most 0.1s; reading the response
+    gets the budget minus the connect timeout.
+
+    Returns:
+        Configured async HTTP client (caller must close it)
+
+    Example:
+        >>> client = create_http_client()
+        >>> client.follow_redirects
+        True
+        >>> client.timeout.connect
+        0.3
+        >>> client.timeout.write, client.timeout.pool
+        (0.2, 0.1)
+    """
+    budget = settings.UPSTREAM_TIMEOUT
+    connect_timeout = min(0.3, budget / 3)
+    return httpx.AsyncClient(
+        timeout=httpx.Timeout(
+            connect=connect_timeout,
+            read=budget - connect_timeout,
+            write=min(0.2, budget / 5),
+            pool=min(0.1, budget / 10),
+        ),
+        follow_redirects=True,
+        limits=httpx.Limits(
+            max_keepalive_connections=100,
+            max_connections=200,
+            keepalive_expiry=60,
+        ),
+    )
+
+
 class OpenMeteoClient:
     """Client for fetching weather data from Open-Meteo API.
 
-    Uses httpx for async HTTP requests and tenacity for exponential backoff retries.
+    Uses httpx for async HTTP requests and retries transient failures with
+    exponential backoff.
     Implements timeout handling and proper error classification.
 
+    Either pass a shared httpx client (its lifetime is managed by the caller)
+    or use the client as an async context manager, which creates and closes
+    its own httpx client.
+
     Example:
         >>> async def example():
         ...     async with OpenMeteoClient() as client:
@@ -101,38 +268,45 @@ class OpenMeteoClient:
         ...         return response.current.temperatureC
     """
 
-    def __init__(self):
-        """Initialize the Open-Meteo client with configuration from settings."""
-        self._client: httpx.AsyncClient | None = None
+    def __init__(self, http_client: httpx.AsyncClient | None = None):
+        """Initialize the Open-Meteo client with configuration from settings.
+
+        Args:
+            http_client: Shared HTTP client to use (optional)
+        """
+        self._client = http_client
+        self._owns_client = False
         self._base_url = settings.OPENMETEO_BASE_URL
-        self._timeout = settings.UPSTREAM_TIMEOUT
         self._api_key = settings.OPENMETEO_API_KEY
 
-    async def __aenter__(self):
+        # Query parameters that are the same for every request are encoded once;
+        # only the (already validated) coordinates are formatted per request
+        base_params = [("current", "temperature_2m,wind_speed_10m")]
+        if self._api_key:
+            base_params.append(("apikey", self._api_key))
+        separator = "&" if "?" in self._base_url else "?"
+        self._url_prefix = f"{self._base_url}{separator}latitude="
+        self._url_suffix = "&" + urlencode(base_params)
+
+    async def __aenter__(self) -> Self:
         """Async context manager entry."""
-        self._client = httpx.AsyncClient(
-            timeout=httpx.Timeout(self._timeout),
-            follow_redirects=True,
-        )
+        if self._client is None:
+            self._client = create_http_client()
+            self._owns_client = True
         return self
 
-    async def __aexit__(self, exc_type, exc_val, exc_tb):
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
         """Async context manager exit."""
-        if self._client:
+        if self._owns_client and self._client:
             await self._client.aclose()
+            self._client = None
+            self._owns_client = False
 
-    @retry(
-        retry=retry_if_exception(_should_retry),
-        stop=stop_after_attempt(
-            settings.RETRY_COUNT + 1
-        ),  # +1 because first attempt isn't a retry
-        wait=wait_exponential(
-            min=settings.RETRY_DELAY / 1000.0,  # Convert ms to seconds
-            multiplier=settings.RETRY_BACKOFF_MULTIPLIER,
-        )
-        + wait_random(0, 1),  # Add jitter: 0-1 second random delay
-        reraise=True,
-    )
     async def get_current_weather(
         self,
         latitude: float,
@@ -144,6 +318,10 @@ class OpenMeteoClient:
         Retries on: timeouts, connection errors, 5xx errors.
         Does NOT retry on: 4xx errors, DNS failures, network errors.
 
+        Delays use decorrelated jitter: each one is drawn uniformly between
+        RETRY_DELAY and the previous delay times RETRY_BACKOFF_MULTIPLIER, capped
+        at 30 seconds. Retry settings are read on each call.
+
         Args:
             latitude: Latitude in decimal degrees (-90 to 90)
             longitude: Longitude in decimal degrees (-180 to 180)
@@ -154,6 +332,7 @@ class OpenMeteoClient:
         Raises:
             OpenMeteoTimeoutError: If request times out after all retries
             OpenMeteoUpstreamError: If API returns 5xx error after all retries
+            OpenMeteoPayloadError: If API returns an unexpected payload (no retry)
             OpenMeteoClientError: If API returns 4xx error (no retry)
             OpenMeteoNetworkError: If network error occurs (no retry)
 
@@ -164,59 +343,111 @@ class OpenMeteoClient:
             ...         assert response.location.lat == 52.52
             ...         assert response.source == "open-meteo"
         """
-        if not self._client:
-            raise RuntimeError("Client not initialized. Use async context manager.")
+        retries = settings.RETRY_COUNT
+        base_delay = delay = settings.RETRY_DELAY / 1000.0  # Convert ms to seconds
+        attempt = 0
+        while True:
+            try:
+                return await self._attempt(latitude, longitude)
+            except Exception as e:
+                if attempt == retries or not _should_retry(e):
+                    raise
+            attempt += 1
+            # Decorrelated jitter: each delay is drawn from [base, previous * multiplier]
+            delay = min(
+                random.uniform(  # nosec B311
+                    base_delay, delay * settings.RETRY_BACKOFF_MULTIPLIER
+                ),
+                _MAX_RETRY_DELAY,
+            )
+            await asyncio.sleep(delay)
 
-        # Note: Coordinate rounding to 4 decimals is handled by the caching layer
-        # We pass original coordinates to API and return them in response
+    async def _attempt(
+        self,
+        latitude: float,
+        longitude: float,
+    ) -> WeatherResponse:
+        """Make a single request to the Open-Meteo API.
 
-        # Build query parameters
-        params: dict[str, float | str] = {
-            "latitude": latitude,
-            "longitude": longitude,
-            "current": "temperature_2m,wind_speed_10m",
-        }
+        Args:
+            latitude: Latitude in decimal degrees (-90 to 90)
+            longitude: Longitude in decimal degrees (-180 to 180)
 
-        # Add API key if configured
-        if self._api_key:
-            params["apikey"] = self._api_key
+        Returns:
+            Normalized weather response
 
-        try:
-            # Make request to Open-Meteo API
-            logger.debug(
-                "Fetching weather from Open-Meteo",
-                url=self._base_url,
+        Raises:
+            OpenMeteoTimeoutError: If the request times out
+            OpenMeteoUpstreamError: If API returns 5xx error
+            OpenMeteoPayloadError: If API returns an unexpected payload
+            OpenMeteoClientError: If API returns 4xx error
+            OpenMeteoNetworkError: If a network error occurs
+        """
+        if not self._client:
+            raise RuntimeError(
+                "Client not initialized. Pass an HTTP client or use async context manager."
             )
 
-            response = await self._client.get(
-                self._base_url,
-                params=params,
-            )
+        # Note: Coordinate rounding is handled by the API layer (parse_coordinates)
+        # We pass the given coordinates to the API and return them in the response
 
-            # Handle HTTP errors
-            if response.status_code >= 500:
-                logger.warning(
-                    "Open-Meteo returned 5xx error",
-                    status_code=response.status_code,
-                )
-                raise OpenMeteoUpstreamError(
-                    f"Upstream API returned {response.status_code}"
+        # Build the request URL (API key, if configured, is in the suffix)
+        url = f"{self._url_prefix}{latitude}&longitude={longitude}{self._url_suffix}"
+
+        try:
+            # Make request to Open-Meteo API
+            if LOG_DEBUG:
+                logger.debug(
+                    "Fetching weather from Open-Meteo",
+                    url=self._base_url,
                 )
 
-            if response.status_code >= 400:
+            response = await self._client.get(url)
+
+            # Handle HTTP errors (a single comparison on the success path)
+            status_code = response.status_code
+            if status_code >= 400:
+                if status_code >= 500:
+                    logger.warning(
+                        "Open-Meteo returned 5xx error",
+                        status_code=status_code,
+                    )
+                    raise OpenMeteoUpstreamError(f"Upstream API returned {status_code}")
                 logger.warning(
                     "Open-Meteo returned 4xx error",
-                    status_code=response.status_code,
+                    status_code=status_code,
                 )
-                raise OpenMeteoClientError(
-                    f"Upstream API returned {response.status_code}"
+                raise OpenMeteoClientError(f"Upstream API returned {status_code}")
+
+            # Read only the two values we use instead of validating the whole payload
+            try:
+                payload = orjson.loads(response.content)
+            except orjson.JSONDecodeError as e:
+                logger.warning("Open-Meteo returned invalid JSON")
+                raise OpenMeteoPayloadError(
+                    "Upstream API returned an unexpected payload"
+                ) from e
+            current = payload.get("current") if isinstance(payload, dict) else None
+            if not isinstance(current, dict):
+                logger.warning("Open-Meteo response has no current conditions")
+                raise OpenMeteoPayloadError(
+                    "Upstream API returned an unexpected payload"
                 )
 
-            # Parse response
-            data = OpenMeteoResponse(**response.json())
+            temperature_2m = current.get("temperature_2m")
+            wind_speed_10m = current.get("wind_speed_10m")
+            if not (
+                _is_measurement(temperature_2m) and _is_measurement(wind_speed_10m)
+            ):
+                logger.warning("Open-Meteo returned non-numeric current conditions")
+                raise OpenMeteoPayloadError(
+                    "Upstream API returned an unexpected payload"
+                )
 
-            # Normalize and return with original precision coordinates
-            return self._normalize_response(data, latitude, longitude)
+            # Normalize and return with the requested coordinates
+            return self._normalize_response(
+                temperature_2m, wind_speed_10m, latitude, longitude
+            )
 
         except httpx.TimeoutException as e:
             logger.warning("Open-Meteo request timed out")
@@ -225,8 +456,7 @@ class OpenMeteoClient:
         except httpx.ConnectError as e:
             # ConnectError includes DNS resolution failures and connection refused
             # Do NOT retry on DNS failures (decision: only retry on connection refused)
-            error_msg = str(e).lower()
-            if "name" in error_msg or "dns" in error_msg or "resolve" in error_msg:
+            if _is_dns_failure(e):
                 logger.error("DNS resolution failed for Open-Meteo", error=str(e))
                 raise OpenMeteoNetworkError(
                     "Failed to resolve upstream API hostname"
@@ -242,17 +472,23 @@ class OpenMeteoClient:
 
     def _normalize_response(
         self,
-        data: OpenMeteoResponse,
+        temperature_2m: float | None,
+        wind_speed_10m: float | None,
         latitude: float,
         longitude: float,
     ) -> WeatherResponse:
-        """Normalize Open-Meteo response to our API format.
+        """Normalize Open-Meteo current conditions to our API format.
 
         Rounds temperature and wind speed to 1 decimal place using banker's rounding.
-        Uses the current UTC time as retrievedAt.
+        Uses the current UTC time (truncated to whole seconds) as retrievedAt.
+
+        The response models are built with model_construct, skipping validation.
+        Callers must pass coordinates that are already validated and rounded
+        (see parse_coordinates) and measurements checked with _is_measurement.
 
         Args:
-            data: Raw Open-Meteo API response
+            temperature_2m: Temperature from the response's current block
+            wind_speed_10m: Wind speed from the response's current block
             latitude: Rounded latitude for response
             longitude: Rounded longitude for response
 
@@ -261,44 +497,20 @@ class OpenMeteoClient:
 
         Example:
             >>> client = OpenMeteoClient()
-            >>> from datetime import datetime, timezone
-            >>> omr = OpenMeteoResponse(
-            ...     latitude=52.52,
-            ...     longitude=13.41,
-            ...     generationtime_ms=0.123,
-            ...     utc_offset_seconds=0,
-            ...     timezone="GMT",
-            ...     timezone_abbreviation="GMT",
-            ...     elevation=38.0,
-            ...     current_units={"time": "iso8601", "interval": "seconds",
-            ...                   "temperature_2m": "°C", "wind_speed_10m": "km/h"},
-            ...     current={"time": "2026-01-11T10:12", "interval": 900,
-            ...             "temperature_2m": 1.23456, "wind_speed_10m": 9.76543}
-            ... )
-            >>> response = client._normalize_response(omr, 52.52, 13.41)
+            >>> response = client._normalize_response(1.23456, 9.76543, 52.52, 13.41)
             >>> response.current.temperatureC
             1.2
             >>> response.current.windSpeedKmh
             9.8
         """
-        # Round values to 1 decimal place (banker's rounding is Python's default)
-        temperature = (
-            round(data.current.temperature_2m, 1)
-            if data.current.temperature_2m is not None
-            else None
-        )
-        wind_speed = (
-            round(data.current.wind_speed_10m, 1)
-            if data.current.wind_speed_10m is not None
-            else None
-        )
-
-        return WeatherResponse(
-            location=LocationModel(lat=latitude, lon=longitude),
-            current=CurrentWeatherModel(
-                temperatureC=temperature,
-                windSpeedKmh=wind_speed,
+        # Every field is produced here from already checked values, so the
+        # models are built without running validation again
+        return WeatherResponse.model_construct(
+            location=LocationModel.model_construct(lat=latitude, lon=longitude),
+            current=CurrentWeatherModel.model_construct(
+                temperatureC=_round1(temperature_2m),
+                windSpeedKmh=_round1(wind_speed_10m),
             ),
             source="open-meteo",
-            retrievedAt=datetime.now(timezone.utc),
+            retrievedAt=_now_utc(),
         )
@@ -1,13 +1,14 @@
 """Weather service with caching and request coalescing."""
 
 import asyncio
-from collections import defaultdict
 from collections.abc import Awaitable, Callable
+from functools import partial
 
+import httpx
 from fastapi import HTTPException
 from loguru import logger
 
-from ..core.config import settings
+from ..core.config import LOG_DEBUG, settings
 from ..models.weather import WeatherResponse
 from ..services.openmeteo import (
     OpenMeteoClient,
@@ -16,6 +17,7 @@ from ..services.openmeteo import (
     OpenMeteoNetworkError,
     OpenMeteoTimeoutError,
     OpenMeteoUpstreamError,
+    create_http_client,
 )
 
 
@@ -23,7 +25,9 @@ class RequestCoalescer:
     """Implements request coalescing to prevent thundering herd.
 
     When multiple concurrent requests arrive for the same coordinates (cache miss),
-    the first request fetches from upstream while others wait for the result.
+    the first request starts an upstream fetch task and every request awaits it.
+    The task is forgotten as soon as it finishes, so results are never reused
+    after the fact (caching is the response cache's job).
     Limits concurrent waiters per coordinate to prevent unbounded memory growth.
 
     Example:
@@ -38,12 +42,25 @@ class RequestCoalescer:
         Args:
             max_waiters: Maximum concurrent waiters per coordinate
         """
-        self._locks: dict[tuple[float, float], asyncio.Lock] = defaultdict(asyncio.Lock)
-        self._events: dict[tuple[float, float], asyncio.Event] = {}
-        self._results: dict[tuple[float, float], WeatherResponse | Exception] = {}
-        self._waiter_counts: dict[tuple[float, float], int] = defaultdict(int)
+        self._inflight: dict[tuple[float, float], asyncio.Future[WeatherResponse]] = {}
+        self._waiter_counts: dict[asyncio.Future[WeatherResponse], int] = {}
         self._max_waiters = max_waiters
 
+    def _fetch_done(
+        self, key: tuple[float, float], task: asyncio.Future[WeatherResponse]
+    ) -> None:
+        """Forget a finished fetch.
+
+        Args:
+            key: Coordinates the fetch was for
+            task: The finished fetch task
+        """
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        # Mark the exception as retrieved even if every awaiting request was cancelled
+        if not task.cancelled():
+            task.exception()
+
     async def coalesce(
         self,
         latitude: float,
@@ -52,6 +69,10 @@ class RequestCoalescer:
     ) -> WeatherResponse:
         """Coalesce requests for the same coordinates.
 
+        The fetch runs as its own task and is awaited through asyncio.shield,
+        so a cancelled request (e.g. client disconnect) does not cancel the
+        fetch the other requests are waiting for.
+
         Args:
             latitude: Rounded latitude (cache key)
             longitude: Rounded longitude (cache key)
@@ -61,98 +82,49 @@ class RequestCoalescer:
             Weather response
 
         Raises:
-            HTTPException: If too many concurrent waiters or fetch fails
+            HTTPException: If too many concurrent waiters
+            Exception: Whatever fetch_func raised
         """
         key = (latitude, longitude)
 
-        async with self._locks[key]:
-            # Check if already fetching
-            if key in self._events:
-                # Check waiter limit
-                if self._waiter_counts[key] >= self._max_waiters:
-                    logger.warning(
-                        "Request coalescing limit exceeded",
-                        waiters=self._waiter_counts[key],
-                        max_waiters=self._max_waiters,
-                    )
-                    raise HTTPException(
-                        status_code=503,
-                        detail={
-                            "error": "Service temporarily unavailable - too many concurrent requests"
-                        },
-                    )
-
-                # Wait for existing fetch to complete
-                self._waiter_counts[key] += 1
-                logger.debug(
-                    "Request coalescing - waiting for existing fetch",
-                    waiters=self._waiter_counts[key],
-                )
-
-        # Wait outside the lock
-        if key in self._events:
-            try:
-                await self._events[key].wait()
-
-                # Get result
-                result = self._results.get(key)
-                if isinstance(result, Exception):
-                    raise result
-                elif result is None:
-                    # Should not happen, but handle gracefully
-                    raise HTTPException(
-                        status_code=500,
-                        detail={"error": "Internal server error"},
-                    )
-                return result
-
-            finally:
-                async with self._locks[key]:
-                    self._waiter_counts[key] -= 1
-
-                    # Clean up if last waiter
-                    if self._waiter_counts[key] == 0:
-                        self._events.pop(key, None)
-                        self._results.pop(key, None)
-                        self._waiter_counts.pop(key, None)
-                        self._locks.pop(key, None)
-
-        # We're the first request - do the fetch
-        async with self._locks[key]:
-            # Double-check after acquiring lock
-            if key in self._events:
-                # Another request became first while we waited
-                self._waiter_counts[key] += 1
-
-            else:
-                # We're definitely first - create event
-                self._events[key] = asyncio.Event()
-
-        # Check if we're now a waiter
-        if self._waiter_counts[key] > 0:
-            # Recursive call to wait
-            return await self.coalesce(latitude, longitude, fetch_func)
+        # No lock needed: nothing is awaited between the lookup and the insert
+        task = self._inflight.get(key)
+        if task is None:
+            if LOG_DEBUG:
+                logger.debug("Request coalescing - fetching from upstream")
+            task = asyncio.ensure_future(fetch_func())
+            self._inflight[key] = task
+            task.add_done_callback(partial(self._fetch_done, key))
+            return await asyncio.shield(task)
+
+        waiters = self._waiter_counts.get(task, 0)
+        if waiters >= self._max_waiters:
+            logger.warning(
+                "Request coalescing limit exceeded",
+                waiters=waiters,
+                max_waiters=self._max_waiters,
+            )
+            raise HTTPException(
+                status_code=503,
+                detail={
+                    "error": "Service temporarily unavailable - too many concurrent requests"
+                },
+            )
 
-        # Do the actual fetch
+        self._waiter_counts[task] = waiters + 1
+        if LOG_DEBUG:
+            logger.debug(
+                "Request coalescing - waiting for existing fetch",
+                waiters=waiters + 1,
+            )
         try:
-            logger.debug("Request coalescing - fetching from upstream")
-            result = await fetch_func()
-            self._results[key] = result
-
-            # Notify waiters
-            self._events[key].set()
-
-            return result
-
-        except Exception as e:
-            # Store exception for waiters
-            self._results[key] = e
-
-            # Notify waiters
-            if key in self._events:
-                self._events[key].set()
-
-            raise
+            return await asyncio.shield(task)
+        finally:
+            remaining = self._waiter_counts[task] - 1
+            if remaining:
+                self._waiter_counts[task] = remaining
+            else:
+                del self._waiter_counts[task]
 
 
 class WeatherService:
@@ -163,7 +135,7 @@ class WeatherService:
     - Request coalescing to prevent thundering herd
     - Error handling and HTTP exception mapping
 
-    Note: Caching is handled at the FastAPI route level using fastapi-cache2 decorators.
+    Note: Response caching is handled in front of the route by WeatherCacheMiddleware.
 
     Example:
         >>> async def example():
@@ -172,9 +144,29 @@ class WeatherService:
         ...     return response.current.temperatureC
     """
 
-    def __init__(self):
+    def __init__(self) -> None:
         """Initialize weather service."""
         self._coalescer = RequestCoalescer(max_waiters=settings.REQUEST_COALESCE_LIMIT)
+        self._http_client: httpx.AsyncClient | None = None
+        self._upstream: OpenMeteoClient | None = None
+
+    async def start(self) -> None:
+        """Open the shared HTTP client used for all upstream requests.
+
+        Called once at application startup.
+        """
+        self._http_client = create_http_client()
+        self._upstream = OpenMeteoClient(self._http_client)
+
+    async def close(self) -> None:
+        """Close the shared HTTP client.
+
+        Called once at application shutdown.
+        """
+        if self._http_client is not None:
+            await self._http_client.aclose()
+        self._http_client = None
+        self._upstream = None
 
     async def get_current_weather(
         self,
@@ -184,11 +176,11 @@ class WeatherService:
         """Get current weather for coordinates.
 
         Implements request coalescing and error handling.
-        Returns cached data if available (handled by FastAPI route decorator).
+        Cached responses are served by WeatherCacheMiddleware before this is called.
 
         Args:
-            latitude: Latitude in decimal degrees
-            longitude: Longitude in decimal degrees
+            latitude: Latitude in decimal degrees, rounded by parse_coordinates
+            longitude: Longitude in decimal degrees, rounded by parse_coordinates
 
         Returns:
             Normalized weather response
@@ -202,22 +194,19 @@ class WeatherService:
             ...     response = await service.get_current_weather(52.52, 13.41)
             ...     assert response.source == "open-meteo"
         """
-        # Round coordinates for cache key consistency
-        rounded_lat = round(latitude, 4)
-        rounded_lon = round(longitude, 4)
 
         # Define fetch function for coalescer
         async def fetch():
+            if self._upstream is not None:
+                return await self._upstream.get_current_weather(latitude, longitude)
+            # Not started (used outside the application): one-off HTTP client
             async with OpenMeteoClient() as client:
                 return await client.get_current_weather(latitude, longitude)
 
         try:
-            # Use request coalescing
-            return await self._coalescer.coalesce(
-                rounded_lat,
-                rounded_lon,
-                fetch,
-            )
+            # Coordinates arrive already rounded by parse_coordinates, so they
+            # are used as the coalescing key as-is
+            return await self._coalescer.coalesce(latitude, longitude, fetch)
 
         except OpenMeteoTimeoutError as e:
             logger.warning("Upstream API timeout")
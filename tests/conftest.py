@@ -2,23 +2,22 @@
 
 import pytest
 from fastapi.testclient import TestClient
-from fastapi_cache import FastAPICache
-from fastapi_cache.backends.inmemory import InMemoryBackend
 
 from src.real_temperature_proxy_api.app import app
+from src.real_temperature_proxy_api.core.cache import weather_cache
 
 
 @pytest.fixture(scope="function", autouse=True)
-def setup_cache():
-    """Initialize FastAPI cache for each test."""
-    FastAPICache.init(InMemoryBackend(), prefix="test-cache:")
-    yield
-    # Reset after test
-    FastAPICache.reset()
+async def setup_cache():
+    """Start each test with an empty response cache."""
+    await weather_cache.clear()
 
 
-@pytest.fixture(scope="function")
+@pytest.fixture(scope="session")
 def client():
-    """Create a test client for the FastAPI application."""
+    """Create a test client for the FastAPI application.
+
+    The application lifespan (startup and shutdown) runs once per session.
+    """
     with TestClient(app) as test_client:
         yield test_client
@@ -1,5 +1,14 @@
 """Tests for API endpoints."""
 
+import math
+import time
+
+from fastapi.testclient import TestClient
+
+from src.real_temperature_proxy_api import app as app_module
+from src.real_temperature_proxy_api.api.health import ReadinessEndpoint
+from src.real_temperature_proxy_api.app import ASGIErrorMiddleware
+
 
 class TestHealthEndpoints:
     """Test health check endpoints."""
@@ -18,6 +27,24 @@ class TestHealthEndpoints:
         assert response.status_code == 200
         assert response.json() == {"status": "ok"}
 
+    def test_readiness_failure_returns_503(self):
+        """Test that a failing readiness check returns 503 and is cached."""
+        calls = 0
+
+        async def failing_check():
+            nonlocal calls
+            calls += 1
+            raise RuntimeError("not ready")
+
+        test_client = TestClient(ReadinessEndpoint(checks=(failing_check,)))
+        response = test_client.get("/ready")
+        assert response.status_code == 503
+        assert response.json() == {"status": "unavailable"}
+
+        # Second probe within the cache interval reuses the outcome
+        assert test_client.get("/ready").status_code == 503
+        assert calls == 1
+
 
 class TestWeatherEndpoint:
     """Test weather endpoint."""
@@ -46,14 +73,19 @@ class TestWeatherEndpoint:
         assert "error" in json_response["detail"]
 
     def test_invalid_coordinates(self, client):
-        """Test that invalid coordinates return 400."""
+        """Test that invalid coordinates return 422."""
         # Latitude out of range
         response = client.get("/v1/current?lat=91.0&lon=13.41")
-        assert response.status_code == 422  # FastAPI validation error
+        assert response.status_code == 422  # Out of range (parse_coordinates)
 
         # Longitude out of range
         response = client.get("/v1/current?lat=52.52&lon=181.0")
-        assert response.status_code == 422  # FastAPI validation error
+        assert response.status_code == 422  # Out of range (parse_coordinates)
+
+        # Not a number
+        response = client.get("/v1/current?lat=north&lon=13.41")
+        assert response.status_code == 422
+        assert "error" in response.json()["detail"]
 
     def test_conflicting_parameters(self, client):
         """Test that conflicting parameters return 400."""
@@ -71,6 +103,11 @@ class TestWeatherEndpoint:
         assert "detail" in json_response
         assert "Conflicting" in json_response["detail"]["error"]
 
+        # Conflicts are detected regardless of parameter name case
+        response = client.get("/v1/current?LAT=52.52&Latitude=52.53&lon=13.41")
+        assert response.status_code == 400
+        assert "Conflicting" in response.json()["detail"]["error"]
+
     def test_parameter_name_variations(self, client):
         """Test that both short and long parameter names work."""
         # Note: These will fail without mocking the Open-Meteo API
@@ -110,6 +147,33 @@ class TestMetricsEndpoint:
         assert response.status_code == 200
         # Metrics should be in text/plain format
         assert "text/plain" in response.headers.get("content-type", "")
+        assert response.headers["cache-control"] == "no-cache"
+
+    def test_metrics_gzip(self, client):
+        """Test that scrapes accepting gzip get a compressed exposition."""
+        response = client.get("/metrics", headers={"Accept-Encoding": "gzip"})
+
+        assert response.status_code == 200
+        assert response.headers["content-encoding"] == "gzip"
+        assert "text/plain" in response.headers["content-type"]
+
+    def test_metrics_record_request_duration(self, client, monkeypatch):
+        """Test that served requests show up in the duration histogram."""
+        # Start from a fresh exposition rather than one cached by another test
+        monkeypatch.setattr(app_module, "_metrics_cache", (-math.inf, b""))
+        client.get("/health")
+        response = client.get("/metrics")
+
+        assert "http_server_duration_milliseconds" in response.text
+
+    def test_metrics_served_from_recent_exposition(self, client, monkeypatch):
+        """Test that a scrape reuses an exposition generated under a second ago."""
+        monkeypatch.setattr(
+            app_module, "_metrics_cache", (time.monotonic(), b"# cached\n")
+        )
+        response = client.get("/metrics")
+
+        assert response.content == b"# cached\n"
 
 
 class TestCORS:
@@ -125,3 +189,47 @@ class TestCORS:
         # Should have CORS headers
         assert "access-control-allow-origin" in response.headers
         assert response.headers["access-control-allow-origin"] == "*"
+
+    def test_cors_preflight(self, client):
+        """Test that preflight requests are answered directly."""
+        response = client.options(
+            "/v1/current",
+            headers={
+                "Origin": "https://example.com",
+                "Access-Control-Request-Method": "GET",
+            },
+        )
+
+        assert response.status_code == 200
+        assert response.headers["access-control-allow-origin"] == "*"
+        assert response.headers["access-control-allow-methods"] == "*"
+
+
+class TestAcceptHeader:
+    """Test Accept header validation."""
+
+    def test_non_json_accept_header(self, client):
+        """Test that requests not accepting JSON return 406."""
+        response = client.get(
+            "/v1/current?lat=52.52&lon=13.41",
+            headers={"Accept": "text/html"},
+        )
+
+        assert response.status_code == 406
+        assert response.json() == {"error": "This API only returns application/json"}
+
+
+class TestErrorHandling:
+    """Test handling of unhandled errors."""
+
+    def test_unhandled_exception_returns_500(self):
+        """Test that unhandled exceptions return a generic 500 response."""
+
+        async def failing_app(scope, receive, send):
+            raise RuntimeError("boom")
+
+        test_client = TestClient(ASGIErrorMiddleware(failing_app))
+        response = test_client.get("/v1/current")
+
+        assert response.status_code == 500
+        assert response.json() == {"error": "Internal server error"}
@@ -1,10 +1,18 @@
 """Tests for LRU cache backend."""
 
+import sys
+import time
+
 import pytest
 
 from src.real_temperature_proxy_api.core.cache import LRUInMemoryBackend
 
 
+def _footprint(cache: LRUInMemoryBackend) -> int:
+    """Shallow size in bytes of the cache's internal containers."""
+    return sum(sys.getsizeof(value) for value in vars(cache).values())
+
+
 class TestLRUCache:
     """Test LRU cache implementation."""
 
@@ -84,6 +92,69 @@ class TestLRUCache:
         result = await cache.get("key1")
         assert result is None
 
+    @pytest.mark.asyncio
+    async def test_delete_frees_slot(self):
+        """Test that a deleted entry's slot is reused without evicting."""
+        cache = LRUInMemoryBackend(max_size=3)
+
+        await cache.set("a", 1, 60)
+        await cache.set("b", 2, 60)
+        await cache.set("c", 3, 60)
+        await cache.delete("b")
+
+        await cache.set("d", 4, 60)
+
+        assert cache.size() == 3
+        assert await cache.get("a") == 1
+        assert await cache.get("c") == 3
+        assert await cache.get("d") == 4
+
+    @pytest.mark.asyncio
+    async def test_slots_grow_on_demand(self):
+        """Test that slots are allocated per entry rather than up front."""
+        cache = LRUInMemoryBackend(max_size=1_000_000)
+
+        await cache.set("a", 1, 60)
+        await cache.set("b", 2, 60)
+
+        assert cache.size() == 2
+        # A million preallocated slots would take several megabytes
+        assert _footprint(cache) < 10_000
+
+    @pytest.mark.asyncio
+    async def test_clear_releases_slots(self):
+        """Test that clearing drops grown slots back to an empty cache."""
+        cache = LRUInMemoryBackend(max_size=1_000_000)
+        empty = _footprint(cache)
+        for i in range(10_000):
+            await cache.set(f"key{i}", i, 60)
+        assert _footprint(cache) > empty + 100_000
+
+        await cache.clear()
+
+        assert cache.size() == 0
+        assert _footprint(cache) == empty
+
+    @pytest.mark.asyncio
+    async def test_eviction_after_slots_grow_to_max_size(self):
+        """Test that eviction kicks in once the grown slots reach max_size."""
+        cache = LRUInMemoryBackend(max_size=3)
+        await cache.set("a", 1, 60)
+        await cache.set("b", 2, 60)
+        await cache.clear()
+
+        await cache.set("c", 3, 60)
+        await cache.set("d", 4, 60)
+        await cache.set("e", 5, 60)
+        await cache.get("c")  # Referenced, so it gets a second chance
+        await cache.set("f", 6, 60)  # Evicts "d"
+
+        assert cache.size() == 3
+        assert await cache.get("d") is None
+        assert await cache.get("c") == 3
+        assert await cache.get("e") == 5
+        assert await cache.get("f") == 6
+
     @pytest.mark.asyncio
     async def test_clear(self):
         """Test clearing the cache."""
@@ -134,3 +205,32 @@ class TestLRUCache:
 
         await cache.clear()
         assert cache.size() == 0
+
+    @pytest.mark.asyncio
+    async def test_expired_entry(self, monkeypatch):
+        """Test that entries are dropped once their TTL has passed."""
+        cache = LRUInMemoryBackend(max_size=3)
+
+        await cache.set("a", 1, 60)
+        await cache.set("b", 2)  # No TTL: never expires
+
+        now = time.monotonic()
+        monkeypatch.setattr(time, "monotonic", lambda: now + 61)
+
+        assert await cache.get("a") is None
+        assert await cache.get("b") == 2
+        assert cache.size() == 1
+
+    @pytest.mark.asyncio
+    async def test_sync_api_shares_entries(self):
+        """Test that the sync methods see the same entries as the async ones."""
+        cache = LRUInMemoryBackend(max_size=3)
+
+        cache.set_sync("a", 1, 60)
+        assert await cache.get("a") == 1
+
+        await cache.set("b", 2, 60)
+        assert cache.get_sync("b") == 2
+
+        cache.delete_sync("a")
+        assert await cache.get("a") is None
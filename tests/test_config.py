@@ -1,9 +1,11 @@
 """Tests for configuration management."""
 
+from dataclasses import FrozenInstanceError
+
 import pytest
 from pydantic import ValidationError
 
-from src.real_temperature_proxy_api.core.config import Settings
+from src.real_temperature_proxy_api.core.config import Settings, load_settings
 
 
 class TestSettings:
@@ -74,3 +76,15 @@ class TestSettings:
 
         settings = Settings(OPENMETEO_API_KEY="test-key-123")
         assert settings.OPENMETEO_API_KEY == "test-key-123"
+
+
+class TestRuntimeSettings:
+    """Test the frozen runtime settings."""
+
+    def test_load_settings_is_frozen(self):
+        """Test that loaded settings cannot be changed."""
+        settings = load_settings()
+
+        assert settings.CACHE_TTL == 60
+        with pytest.raises(FrozenInstanceError):
+            settings.CACHE_TTL = 1
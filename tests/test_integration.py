@@ -10,17 +10,67 @@ For live testing against the real API:
     pytest tests/test_integration.py --record-mode=none
 """
 
+import socket
+import time
+from dataclasses import replace
+
+import httpx
+import orjson
 import pytest
 from pytest_httpx import HTTPXMock
 
+from src.real_temperature_proxy_api.services import openmeteo
 from src.real_temperature_proxy_api.services.openmeteo import (
     OpenMeteoClient,
     OpenMeteoClientError,
+    OpenMeteoNetworkError,
+    OpenMeteoPayloadError,
     OpenMeteoTimeoutError,
     OpenMeteoUpstreamError,
 )
 
 
+def _forecast_body(
+    latitude: float,
+    longitude: float,
+    temperature_2m: float | None,
+    wind_speed_10m: float | None,
+) -> bytes:
+    """Serialize an Open-Meteo forecast payload for a mocked response."""
+    return orjson.dumps(
+        {
+            "latitude": latitude,
+            "longitude": longitude,
+            "generationtime_ms": 0.123,
+            "utc_offset_seconds": 0,
+            "timezone": "GMT",
+            "timezone_abbreviation": "GMT",
+            "elevation": 38.0,
+            "current_units": {
+                "time": "iso8601",
+                "interval": "seconds",
+                "temperature_2m": "°C",
+                "wind_speed_10m": "km/h",
+            },
+            "current": {
+                "time": "2026-01-20T10:12",
+                "interval": 900,
+                "temperature_2m": temperature_2m,
+                "wind_speed_10m": wind_speed_10m,
+            },
+        }
+    )
+
+
+# Mocked upstream bodies, serialized once at import
+_JSON_HEADERS = {"content-type": "application/json"}
+_BERLIN_BODY = _forecast_body(52.52, 13.41, 1.234, 9.765)
+_SYDNEY_NULLS_BODY = _forecast_body(-33.87, 151.21, None, None)
+_PRECISE_BODY = _forecast_body(52.123456, 13.654321, 5.5, 10.0)
+_NEW_YORK_BODY = _forecast_body(40.71, -74.01, 1.2, 9.7)
+_PARIS_BODY = _forecast_body(48.85, 2.35, 2.5, 15.0)
+
+
 @pytest.mark.integration
 class TestOpenMeteoClientIntegration:
     """Integration tests for Open-Meteo client."""
@@ -31,27 +81,8 @@ class TestOpenMeteoClientIntegration:
         # Mock a successful response
         httpx_mock.add_response(
             url="https://api.open-meteo.com/v1/forecast?latitude=52.52&longitude=13.41&current=temperature_2m%2Cwind_speed_10m",
-            json={
-                "latitude": 52.52,
-                "longitude": 13.41,
-                "generationtime_ms": 0.123,
-                "utc_offset_seconds": 0,
-                "timezone": "GMT",
-                "timezone_abbreviation": "GMT",
-                "elevation": 38.0,
-                "current_units": {
-                    "time": "iso8601",
-                    "interval": "seconds",
-                    "temperature_2m": "°C",
-                    "wind_speed_10m": "km/h",
-                },
-                "current": {
-                    "time": "2026-01-20T10:12",
-                    "interval": 900,
-                    "temperature_2m": 1.234,
-                    "wind_speed_10m": 9.765,
-                },
-            },
+            content=_BERLIN_BODY,
+            headers=_JSON_HEADERS,
         )
 
         async with OpenMeteoClient() as client:
@@ -71,27 +102,8 @@ class TestOpenMeteoClientIntegration:
         """Test weather fetch when API returns null values."""
         httpx_mock.add_response(
             url="https://api.open-meteo.com/v1/forecast?latitude=-33.87&longitude=151.21&current=temperature_2m%2Cwind_speed_10m",
-            json={
-                "latitude": -33.87,
-                "longitude": 151.21,
-                "generationtime_ms": 0.456,
-                "utc_offset_seconds": 0,
-                "timezone": "GMT",
-                "timezone_abbreviation": "GMT",
-                "elevation": 10.0,
-                "current_units": {
-                    "time": "iso8601",
-                    "interval": "seconds",
-                    "temperature_2m": "°C",
-                    "wind_speed_10m": "km/h",
-                },
-                "current": {
-                    "time": "2026-01-20T10:12",
-                    "interval": 900,
-                    "temperature_2m": None,
-                    "wind_speed_10m": None,
-                },
-            },
+            content=_SYDNEY_NULLS_BODY,
+            headers=_JSON_HEADERS,
         )
 
         async with OpenMeteoClient() as client:
@@ -129,6 +141,60 @@ class TestOpenMeteoClientIntegration:
             async with OpenMeteoClient() as client:
                 await client.get_current_weather(52.52, 13.41)
 
+    @pytest.mark.asyncio
+    async def test_upstream_payload_without_current(self, httpx_mock: HTTPXMock):
+        """Test that a payload without current conditions fails without retry."""
+        httpx_mock.add_response(json={"latitude": 52.52, "longitude": 13.41})
+
+        with pytest.raises(OpenMeteoPayloadError):
+            async with OpenMeteoClient() as client:
+                await client.get_current_weather(52.52, 13.41)
+
+        assert len(httpx_mock.get_requests()) == 1
+
+    @pytest.mark.asyncio
+    async def test_upstream_payload_with_string_measurement(
+        self, httpx_mock: HTTPXMock
+    ):
+        """Test that a non-numeric temperature fails without retry."""
+        httpx_mock.add_response(
+            json={"current": {"temperature_2m": "abc", "wind_speed_10m": 9.8}}
+        )
+
+        with pytest.raises(OpenMeteoPayloadError):
+            async with OpenMeteoClient() as client:
+                await client.get_current_weather(52.52, 13.41)
+
+        assert len(httpx_mock.get_requests()) == 1
+
+    @pytest.mark.asyncio
+    async def test_upstream_payload_with_object_measurement(
+        self, httpx_mock: HTTPXMock
+    ):
+        """Test that an object in place of the wind speed fails without retry."""
+        httpx_mock.add_response(
+            json={"current": {"temperature_2m": 1.2, "wind_speed_10m": {}}}
+        )
+
+        with pytest.raises(OpenMeteoPayloadError):
+            async with OpenMeteoClient() as client:
+                await client.get_current_weather(52.52, 13.41)
+
+        assert len(httpx_mock.get_requests()) == 1
+
+    @pytest.mark.asyncio
+    async def test_upstream_payload_with_bool_measurement(self, httpx_mock: HTTPXMock):
+        """Test that a boolean measurement is rejected instead of served as 1.0."""
+        httpx_mock.add_response(
+            json={"current": {"temperature_2m": True, "wind_speed_10m": 9.8}}
+        )
+
+        with pytest.raises(OpenMeteoPayloadError):
+            async with OpenMeteoClient() as client:
+                await client.get_current_weather(52.52, 13.41)
+
+        assert len(httpx_mock.get_requests()) == 1
+
     @pytest.mark.asyncio
     async def test_upstream_4xx_error(self, httpx_mock: HTTPXMock):
         """Test handling of upstream 4xx errors (no retry)."""
@@ -141,35 +207,51 @@ class TestOpenMeteoClientIntegration:
             async with OpenMeteoClient() as client:
                 await client.get_current_weather(52.52, 13.41)
 
+    @pytest.mark.asyncio
+    async def test_api_key_is_url_encoded(self, httpx_mock: HTTPXMock, monkeypatch):
+        """Test that a configured API key is sent as an encoded query parameter."""
+        monkeypatch.setattr(
+            openmeteo, "settings", replace(openmeteo.settings, OPENMETEO_API_KEY="k&y")
+        )
+        httpx_mock.add_response(
+            url="https://api.open-meteo.com/v1/forecast?latitude=52.52&longitude=13.41&current=temperature_2m%2Cwind_speed_10m&apikey=k%26y",
+            json={"current": {"temperature_2m": 1.0, "wind_speed_10m": 2.0}},
+        )
+
+        async with OpenMeteoClient() as client:
+            response = await client.get_current_weather(52.52, 13.41)
+
+        assert response.current.temperatureC == 1.0
+
+    @pytest.mark.asyncio
+    async def test_dns_failure(self, httpx_mock: HTTPXMock):
+        """Test that a hostname resolution failure is reported as such (no retry)."""
+        error = httpx.ConnectError("[Errno -2] Name or service not known")
+        error.__cause__ = socket.gaierror(-2, "Name or service not known")
+        httpx_mock.add_exception(error)
+
+        with pytest.raises(OpenMeteoNetworkError, match="resolve"):
+            async with OpenMeteoClient() as client:
+                await client.get_current_weather(52.52, 13.41)
+
+    def test_retrieved_at_lags_by_less_than_a_second(self, monkeypatch):
+        """Test that the cached retrievedAt follows the wall clock second."""
+        monkeypatch.setattr(openmeteo, "_now_cache", openmeteo._now_cache)
+        for now in (1_000.2, 1_000.99, 1_001.01, 1_001.98, 1_003.5):
+            monkeypatch.setattr(time, "time", lambda now=now: now)
+            lag = now - openmeteo._now_utc().timestamp()
+            assert 0 <= lag < 1
+
     @pytest.mark.asyncio
     async def test_coordinate_rounding(self, httpx_mock: HTTPXMock):
         """Test that coordinates are returned with original precision.
 
-        Note: Rounding to 4 decimal places is only for cache key generation,
-        not for the response coordinates (per decisions.md line 44).
+        Note: Rounding for cache keys happens in the API layer,
+        not in the client (per decisions.md).
         """
         httpx_mock.add_response(
-            json={
-                "latitude": 52.123456,
-                "longitude": 13.654321,
-                "generationtime_ms": 0.123,
-                "utc_offset_seconds": 0,
-                "timezone": "GMT",
-                "timezone_abbreviation": "GMT",
-                "elevation": 38.0,
-                "current_units": {
-                    "time": "iso8601",
-                    "interval": "seconds",
-                    "temperature_2m": "°C",
-                    "wind_speed_10m": "km/h",
-                },
-                "current": {
-                    "time": "2026-01-20T10:12",
-                    "interval": 900,
-                    "temperature_2m": 5.5,
-                    "wind_speed_10m": 10.0,
-                },
-            },
+            content=_PRECISE_BODY,
+            headers=_JSON_HEADERS,
         )
 
         async with OpenMeteoClient() as client:
@@ -191,27 +273,8 @@ class TestWeatherEndpointIntegration:
         # Mock Open-Meteo response with explicit URL matching
         httpx_mock.add_response(
             url="https://api.open-meteo.com/v1/forecast?latitude=40.71&longitude=-74.01&current=temperature_2m%2Cwind_speed_10m",
-            json={
-                "latitude": 40.71,
-                "longitude": -74.01,
-                "generationtime_ms": 0.123,
-                "utc_offset_seconds": 0,
-                "timezone": "GMT",
-                "timezone_abbreviation": "GMT",
-                "elevation": 38.0,
-                "current_units": {
-                    "time": "iso8601",
-                    "interval": "seconds",
-                    "temperature_2m": "°C",
-                    "wind_speed_10m": "km/h",
-                },
-                "current": {
-                    "time": "2026-01-20T10:12",
-                    "interval": 900,
-                    "temperature_2m": 1.2,
-                    "wind_speed_10m": 9.7,
-                },
-            },
+            content=_NEW_YORK_BODY,
+            headers=_JSON_HEADERS,
         )
 
         # First request - should hit the API
@@ -233,6 +296,20 @@ class TestWeatherEndpointIntegration:
 
         # Should be identical (from cache)
         assert data2 == data1
+        assert response2.headers.get_list("access-control-allow-origin") == ["*"]
+
+        # Parameter name variants map to the same cache entry
+        response3 = client.get("/v1/current?LATITUDE=40.71&Lon=-74.01")
+        assert response3.status_code == 200
+        assert response3.json() == data1
+
+        # Nearby coordinates round to the same 2-decimal location
+        response4 = client.get("/v1/current?lat=40.7128&lon=-74.0060")
+        assert response4.status_code == 200
+        assert response4.json() == data1
+
+        # Only the first request reached Open-Meteo
+        assert len(httpx_mock.get_requests()) == 1
 
     @pytest.mark.asyncio
     async def test_concurrent_requests_coalescing(self, client, httpx_mock: HTTPXMock):
@@ -242,27 +319,8 @@ class TestWeatherEndpointIntegration:
         # Mock response with explicit URL matching
         httpx_mock.add_response(
             url="https://api.open-meteo.com/v1/forecast?latitude=48.85&longitude=2.35&current=temperature_2m%2Cwind_speed_10m",
-            json={
-                "latitude": 48.85,
-                "longitude": 2.35,
-                "generationtime_ms": 0.123,
-                "utc_offset_seconds": 0,
-                "timezone": "GMT",
-                "timezone_abbreviation": "GMT",
-                "elevation": 38.0,
-                "current_units": {
-                    "time": "iso8601",
-                    "interval": "seconds",
-                    "temperature_2m": "°C",
-                    "wind_speed_10m": "km/h",
-                },
-                "current": {
-                    "time": "2026-01-20T10:12",
-                    "interval": 900,
-                    "temperature_2m": 2.5,
-                    "wind_speed_10m": 15.0,
-                },
-            },
+            content=_PARIS_BODY,
+            headers=_JSON_HEADERS,
         )
 
         # Make request
@@ -111,6 +111,28 @@ class TestWeatherResponse:
 
         assert response.source == "open-meteo"
 
+    def test_immutable(self):
+        """Test that responses are frozen and reject unknown fields."""
+        response = WeatherResponse(
+            location=LocationModel(lat=52.52, lon=13.41),
+            current=CurrentWeatherModel(temperatureC=1.2, windSpeedKmh=9.7),
+            retrievedAt=datetime.now(timezone.utc),
+        )
+
+        with pytest.raises(ValidationError):
+            response.source = "other"  # type: ignore[misc]
+
+        with pytest.raises(ValidationError):
+            response.current.temperatureC = 0.0  # type: ignore[misc]
+
+        with pytest.raises(ValidationError):
+            WeatherResponse(
+                location=LocationModel(lat=52.52, lon=13.41),
+                current=CurrentWeatherModel(temperatureC=1.2, windSpeedKmh=9.7),
+                retrievedAt=datetime.now(timezone.utc),
+                extra="field",
+            )
+
     def test_json_serialization(self):
         """Test that response can be serialized to JSON."""
         response = WeatherResponse(
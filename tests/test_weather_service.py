@@ -0,0 +1,90 @@
+"""Tests for weather service request coalescing."""
+
+import asyncio
+
+import pytest
+from fastapi import HTTPException
+
+from src.real_temperature_proxy_api.services.weather import RequestCoalescer
+
+
+class TestRequestCoalescer:
+    """Test request coalescing."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_requests_share_fetch(self):
+        """Test that concurrent requests for the same key run one fetch."""
+        coalescer = RequestCoalescer()
+        calls = 0
+        release = asyncio.Event()
+
+        async def fetch():
+            nonlocal calls
+            calls += 1
+            await release.wait()
+            return "result"
+
+        tasks = [
+            asyncio.create_task(coalescer.coalesce(52.52, 13.41, fetch))
+            for _ in range(5)
+        ]
+        await asyncio.sleep(0)
+        release.set()
+
+        assert await asyncio.gather(*tasks) == ["result"] * 5
+        assert calls == 1
+
+    @pytest.mark.asyncio
+    async def test_finished_fetch_is_not_reused(self):
+        """Test that a later request fetches again instead of reusing a result."""
+        coalescer = RequestCoalescer()
+        calls = 0
+
+        async def fetch():
+            nonlocal calls
+            calls += 1
+            return calls
+
+        assert await coalescer.coalesce(52.52, 13.41, fetch) == 1
+        await asyncio.sleep(0)  # Let the done callback run
+        assert await coalescer.coalesce(52.52, 13.41, fetch) == 2
+
+    @pytest.mark.asyncio
+    async def test_fetch_error_propagates_to_waiters(self):
+        """Test that every coalesced request sees the fetch error."""
+        coalescer = RequestCoalescer()
+
+        async def fetch():
+            await asyncio.sleep(0)
+            raise ValueError("upstream failed")
+
+        results = await asyncio.gather(
+            coalescer.coalesce(52.52, 13.41, fetch),
+            coalescer.coalesce(52.52, 13.41, fetch),
+            return_exceptions=True,
+        )
+
+        assert all(isinstance(result, ValueError) for result in results)
+
+    @pytest.mark.asyncio
+    async def test_waiter_limit(self):
+        """Test that waiters beyond the limit get 503."""
+        coalescer = RequestCoalescer(max_waiters=1)
+        release = asyncio.Event()
+
+        async def fetch():
+            await release.wait()
+            return "result"
+
+        first = asyncio.create_task(coalescer.coalesce(52.52, 13.41, fetch))
+        await asyncio.sleep(0)
+        waiter = asyncio.create_task(coalescer.coalesce(52.52, 13.41, fetch))
+        await asyncio.sleep(0)
+
+        with pytest.raises(HTTPException) as exc_info:
+            await coalescer.coalesce(52.52, 13.41, fetch)
+        assert exc_info.value.status_code == 503
+
+        release.set()
+        assert await first == "result"
+        assert await waiter == "result"